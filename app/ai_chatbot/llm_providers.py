@@ -2,7 +2,6 @@
 LLM Provider Abstraction Layer
 Supports Anthropic Claude and OpenAI GPT models
 """
-import httpx
 import logging
 from typing import Optional, Dict, Any, Callable
 from abc import ABC, abstractmethod
@@ -66,6 +65,10 @@ class ClaudeProvider(LLMProvider):
             "messages": messages,
         }
 
+        # httpx is imported on first use; it is a noticeable share of worker
+        # start-up time and is only needed once a chat request reaches an LLM.
+        import httpx
+
         try:
             async with httpx.AsyncClient(timeout=60.0) as client:
                 response = await client.post(
@@ -176,6 +179,8 @@ class ChatGPTProvider(LLMProvider):
             "Content-Type": "application/json",
         }
 
+        import httpx  # deferred, see ClaudeProvider.query
+
         try:
             async with httpx.AsyncClient(timeout=60.0) as client:
                 response = await client.post(endpoint, headers=headers, json=payload)
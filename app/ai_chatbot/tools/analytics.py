@@ -27,6 +27,13 @@ from app.models import (
 )
 from .types import ToolResult, UserScope
 
+# PartyType is a str enum, so this also matches the raw "COMPANY"/"INDIVIDUAL"
+# column values; anything else takes the normalising fallback.
+_COMPANY_PARTY_FLAGS: dict[Any, bool] = {
+    PartyType.COMPANY: True,
+    PartyType.INDIVIDUAL: False,
+}
+
 
 def _as_float(value: Decimal | float | int | None) -> float:
     if value is None:
@@ -48,6 +55,15 @@ def _start_date(days: Any) -> date:
     return date.today() - timedelta(days=clean_days)
 
 
+def _is_company_party(party_type: Any) -> bool:
+    """Return whether a party type value (enum, string or None) is a company."""
+    flag = _COMPANY_PARTY_FLAGS.get(party_type)
+    if flag is None:
+        raw_type = getattr(party_type, "value", party_type) or ""
+        flag = str(raw_type).upper().startswith("COMPANY")
+    return flag
+
+
 def _normalize_direction(value: Any) -> str:
     """Sanitize leaderboard direction."""
     text = str(value or "top").strip().lower()
@@ -264,8 +280,8 @@ def flex_analytics(
         party_totals: dict[int, float] = {}
 
         def _metric_value(r: Any) -> float:
-            income_val = _as_float(getattr(r, "income_total", 0))
-            expense_val = _as_float(getattr(r, "expense_total", 0))
+            income_val = _as_float(r.income_total)
+            expense_val = _as_float(r.expense_total)
             if metric_key == "income":
                 return income_val
             if metric_key == "expenses":
@@ -369,8 +385,8 @@ def flex_analytics(
             "party_id": display_id_map.get(row.party_id, row.party_id),
             "party_name": row.party_name,
             "party_type": row.party_type,
-            "holdings_value": _as_float(getattr(row, "holdings_value", 0)),
-            "holdings_unrealized_pl": _as_float(getattr(row, "holdings_unrealized_pl", 0)),
+            "holdings_value": _as_float(row.holdings_value),
+            "holdings_unrealized_pl": _as_float(row.holdings_unrealized_pl),
         }
         for row in rows
     ]
@@ -746,24 +762,30 @@ def leaderboard(
         company_id: Any = None,
         user_id: Any = None,
     ) -> str:
-        raw_type = getattr(party_type, "value", party_type) or ""
-        type_text = str(raw_type).upper()
-        if type_text.startswith("COMPANY"):
+        if _is_company_party(party_type):
             return f"/corporate/{company_id or party_id}"
         return f"/individuals/{user_id or party_id}"
 
+    # Which optional columns exist depends on the metric's query; check once
+    # per result set rather than probing every row with getattr.
+    fields = set(rows[0]._fields) if rows else set()
+    has_company_id = "company_id" in fields
+    has_user_id = "user_id" in fields
+    has_party_type = "party_type" in fields
+
     data = []
     for row in rows:
-        company_id = getattr(row, "company_id", None)
-        user_id = getattr(row, "user_id", None)
+        company_id = row.company_id if has_company_id else None
+        user_id = row.user_id if has_user_id else None
+        party_type = row.party_type if has_party_type else None
         data.append(
             {
                 "party_name": row.party_name,
                 "party_id": row.party_id,
-                "party_type": getattr(row, "party_type", None),
+                "party_type": party_type,
                 "party_url": _party_url(
                     row.party_id,
-                    getattr(row, "party_type", ""),
+                    party_type if has_party_type else "",
                     company_id,
                     user_id,
                 ),
@@ -942,9 +964,7 @@ def party_insights(
         individual_id: Optional[int],
         company_id: Optional[int],
     ) -> str:
-        raw_type = getattr(target_type, "value", target_type) or ""
-        type_text = str(raw_type).upper()
-        if type_text.startswith("COMPANY"):
+        if _is_company_party(target_type):
             link_id = company_id or target_id
             return f"/corporate/{link_id}"
         link_id = individual_id or target_id
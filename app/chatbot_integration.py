@@ -12,7 +12,7 @@ from sqlalchemy import select
 
 from app.chatbot_schema import DATABASE_SCHEMA
 from app.core.logger import get_logger
-from app.core.security import AuthenticatedUser
+from app.core.security import AuthenticatedUser, current_user
 from app.db.session import get_sessionmaker
 from app.models import OrgPartyMap
 
@@ -92,7 +92,7 @@ def get_current_user_context_from_request(request: Request) -> Dict[str, Any]:
     Raises:
         HTTPException: If user is not authenticated or not allowed
     """
-    user: AuthenticatedUser | None = getattr(request.state, "user", None)
+    user: AuthenticatedUser | None = current_user()
 
     if user is None:
         raise HTTPException(
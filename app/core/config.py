@@ -4,12 +4,34 @@ from __future__ import annotations
 from dataclasses import dataclass
 import os
 from pathlib import Path
+from types import MappingProxyType
+from typing import Final, Mapping
 
-from dotenv import load_dotenv
+from .envfile import load_env_file
 
 # Load .env file from project root
 env_path = Path(__file__).parent.parent.parent / ".env"
-load_dotenv(dotenv_path=env_path)
+load_env_file(env_path)
+
+# Fallback values used when an environment variable is not set.
+_DEFAULTS: Final[Mapping[str, str]] = MappingProxyType(
+    {
+        "DB_DRIVER": "mysql+pymysql",
+        "DB_HOST": "127.0.0.1",
+        "DB_PORT": "3306",
+        "DB_USER": "finance",
+        "DB_PASSWORD": "finance",
+        "DB_NAME": "finance",
+        "JWT_SECRET_KEY": "change-me",
+        "JWT_ALGORITHM": "HS256",
+        "JWT_EXPIRE_MINUTES": "120",
+        "ADMIN_USERNAME": "admin",
+        "ADMIN_PASSWORD": "demo",
+        "DEMO_USER_PASSWORD": "demo",
+        "APP_DEBUG": "0",
+        "ADMIN_SNAPSHOT": "0",
+    }
+)
 
 
 @dataclass(slots=True)
@@ -53,34 +75,42 @@ class Settings:
 
     database: DatabaseSettings
     auth: AuthSettings
+    debug: bool = False
+    # Share warmed admin datasets between workers through an on-disk
+    # snapshot. Off by default: edits that do not add rows are not detected.
+    admin_snapshot: bool = False
 
     @classmethod
     def from_env(cls) -> "Settings":
         """Load configuration values from environment variables."""
 
-        def _get_env(name: str, default: str) -> str:
-            return os.getenv(name, default)
-
+        env = os.environ
+        defaults = _DEFAULTS
 
         db = DatabaseSettings(
-            driver=_get_env("DB_DRIVER", "mysql+pymysql"),
-            host=_get_env("DB_HOST", "127.0.0.1"),
-            port=int(_get_env("DB_PORT", "3306")),
-            user=_get_env("DB_USER", "finance"),
-            password=_get_env("DB_PASSWORD", "finance"),
-            name=_get_env("DB_NAME", "finance"),
+            driver=env.get("DB_DRIVER", defaults["DB_DRIVER"]),
+            host=env.get("DB_HOST", defaults["DB_HOST"]),
+            port=int(env.get("DB_PORT", defaults["DB_PORT"])),
+            user=env.get("DB_USER", defaults["DB_USER"]),
+            password=env.get("DB_PASSWORD", defaults["DB_PASSWORD"]),
+            name=env.get("DB_NAME", defaults["DB_NAME"]),
         )
         auth = AuthSettings(
-            secret_key=_get_env("JWT_SECRET_KEY", "change-me"),
-            algorithm=_get_env("JWT_ALGORITHM", "HS256"),
-            access_token_expire_minutes=int(_get_env("JWT_EXPIRE_MINUTES", "120")),
-            admin_username=_get_env("ADMIN_USERNAME", "admin"),
-            admin_password=_get_env("ADMIN_PASSWORD", "demo"),
-            demo_user_password=_get_env("DEMO_USER_PASSWORD", "demo"),
+            secret_key=env.get("JWT_SECRET_KEY", defaults["JWT_SECRET_KEY"]),
+            algorithm=env.get("JWT_ALGORITHM", defaults["JWT_ALGORITHM"]),
+            access_token_expire_minutes=int(
+                env.get("JWT_EXPIRE_MINUTES", defaults["JWT_EXPIRE_MINUTES"])
+            ),
+            admin_username=env.get("ADMIN_USERNAME", defaults["ADMIN_USERNAME"]),
+            admin_password=env.get("ADMIN_PASSWORD", defaults["ADMIN_PASSWORD"]),
+            demo_user_password=env.get("DEMO_USER_PASSWORD", defaults["DEMO_USER_PASSWORD"]),
         )
         return cls(
             database=db,
             auth=auth,
+            debug=env.get("APP_DEBUG", defaults["APP_DEBUG"]).lower() in {"1", "true", "yes"},
+            admin_snapshot=env.get("ADMIN_SNAPSHOT", defaults["ADMIN_SNAPSHOT"]).lower()
+            in {"1", "true", "yes"},
         )
 
 
@@ -0,0 +1,62 @@
+"""Minimal ``.env`` file loader used during application start-up."""
+from __future__ import annotations
+
+import os
+import re
+from pathlib import Path
+
+# KEY=value lines, optionally prefixed with ``export``. Comment and blank
+# lines never match, so a single ``finditer`` pass visits only assignments.
+_ASSIGNMENT_RE = re.compile(
+    r"^[ \t]*(?:export[ \t]+)?([A-Za-z_][A-Za-z0-9_]*)[ \t]*=[ \t]*(.*?)[ \t]*$",
+    re.MULTILINE,
+)
+_INLINE_COMMENT_RE = re.compile(r"[ \t]+#.*$")
+# A fully quoted value, optionally followed by an inline comment.
+_QUOTED_RE = re.compile(
+    r"""^(?:"((?:[^"\\]|\\.)*)"|'((?:[^'\\]|\\.)*)')[ \t]*(?:#.*)?$"""
+)
+# Escapes python-dotenv decodes inside double and single quotes respectively.
+_DOUBLE_ESCAPE_RE = re.compile(r"""\\([\\'"abfnrtv])""")
+_SINGLE_ESCAPE_RE = re.compile(r"""\\([\\'])""")
+_ESCAPES = {"a": "\a", "b": "\b", "f": "\f", "n": "\n", "r": "\r", "t": "\t", "v": "\v"}
+
+
+def _unescape(match: re.Match[str]) -> str:
+    char = match.group(1)
+    return _ESCAPES.get(char, char)
+
+
+def _parse_value(raw: str) -> str:
+    """Return the value of an assignment the way python-dotenv reads it."""
+
+    quoted = _QUOTED_RE.match(raw)
+    if quoted is not None:
+        double, single = quoted.groups()
+        if double is not None:
+            return _DOUBLE_ESCAPE_RE.sub(_unescape, double)
+        return _SINGLE_ESCAPE_RE.sub(_unescape, single)
+    return _INLINE_COMMENT_RE.sub("", raw)
+
+
+def load_env_file(path: Path, *, override: bool = False) -> bool:
+    """Populate ``os.environ`` from ``path``.
+
+    Existing environment variables win unless ``override`` is set. Returns
+    ``False`` when the file does not exist.
+    """
+
+    try:
+        content = path.read_text(encoding="utf-8")
+    except FileNotFoundError:
+        return False
+
+    environ = os.environ
+    for match in _ASSIGNMENT_RE.finditer(content):
+        key, raw = match.groups()
+        if override or key not in environ:
+            environ[key] = _parse_value(raw)
+    return True
+
+
+__all__ = ["load_env_file"]
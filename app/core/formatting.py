@@ -2,13 +2,17 @@
 
 from __future__ import annotations
 from decimal import Decimal
+from functools import lru_cache
 
-_UNITS = [
-    (Decimal("1e12"), "trillion", "T"),
-    (Decimal("1e9"), "billion", "B"),
-    (Decimal("1e6"), "million", "M"),
-    (Decimal("1e3"), "thousand", "k"),
-]
+# (integer threshold, Decimal divisor, long suffix, short suffix). The integer
+# threshold selects the unit; the Decimal is only used for the final division.
+_UNITS = (
+    (10**12, Decimal("1e12"), " trillion", "T"),
+    (10**9, Decimal("1e9"), " billion", "B"),
+    (10**6, Decimal("1e6"), " million", "M"),
+    (10**3, Decimal("1e3"), " thousand", "k"),
+)
+_TEN_K = 10_000
 
 def humanize_number(
     value: int | float | Decimal,
@@ -22,29 +26,46 @@ def humanize_number(
         short: If True, use short suffixes (k, M, B, T) instead of full words
         decimals: Number of decimal places to show
     """
-    d = Decimal(str(value))
+    if isinstance(value, Decimal):
+        d = value
+    elif isinstance(value, int):
+        d = Decimal(value)
+    else:
+        d = Decimal(str(value))
     sign = "-" if d < 0 else ""
     d = abs(d)
 
-    def _format_plain_number() -> str:
-        if d == d.to_integral():
-            whole = format(d, "f")
-            if "." in whole:
-                whole = whole.rstrip("0").rstrip(".") or "0"
-            return f"{sign}{whole}"
-        return f"{sign}{d:.{decimals}f}"
+    if not d.is_finite():
+        return f"{sign}{d}"
 
-    if d < Decimal("1e4"):
-        return _format_plain_number()
+    abs_int = int(d)
+    if abs_int < _TEN_K:
+        # Comparing against the truncated int answers "is this integral?"
+        # without allocating a Decimal via to_integral().
+        if d == abs_int:
+            return f"{sign}{abs_int}"
+        return f"{sign}{d:.{decimals}f}"
 
-    for threshold, long_name, short_name in _UNITS:
-        if d >= threshold:
-            if short:
-                return f"{sign}{(d / threshold):.{decimals}f}{short_name}"
-            return f"{sign}{(d / threshold):.{decimals}f} {long_name}"
+    for int_threshold, threshold, long_suffix, short_suffix in _UNITS:
+        if abs_int >= int_threshold:
+            suffix = short_suffix if short else long_suffix
+            return f"{sign}{(d / threshold):.{decimals}f}{suffix}"
 
-    return _format_plain_number()
+    return f"{sign}{abs_int}"
     
+@lru_cache(maxsize=4096)
+def _humanize_currency_cached(
+    value_type: type,
+    value: int | float | Decimal,
+    symbol: str,
+    short: bool,
+    decimals: int,
+) -> str:
+    # ``value_type`` is part of the key because equal float and Decimal values
+    # hash alike but are parsed differently by humanize_number.
+    return f"{symbol} {humanize_number(value, short=short, decimals=decimals)}"
+
+
 def humanize_currency(
     value: int | float | Decimal, 
     symbol: str = "€", 
@@ -52,6 +73,9 @@ def humanize_currency(
     decimals: int = 1
 ) -> str:
     """Format a currency value with human-readable units.
+
+    Results are memoised because dashboards repeat the same totals and zero
+    cells many times per render.
     
     Args:
         value: The currency amount to format
@@ -59,4 +83,4 @@ def humanize_currency(
         short: If True, use short suffixes (k, M, B, T) instead of full words
         decimals: Number of decimal places to show
     """
-    return f"{symbol} {humanize_number(value, short=short, decimals=decimals)}"
+    return _humanize_currency_cached(type(value), value, symbol, short, decimals)
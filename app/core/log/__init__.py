@@ -2,12 +2,16 @@
 """Application-wide logging utilities with rich console output and progress helpers."""
 from __future__ import annotations
 
+import atexit
 import logging
+import os
+import time
 from dataclasses import dataclass
-from datetime import datetime, date
+from functools import lru_cache
+from datetime import date, datetime, timedelta
 from logging.handlers import QueueHandler, QueueListener
 from pathlib import Path
-from queue import SimpleQueue
+from queue import Empty, SimpleQueue
 from threading import RLock
 from typing import Optional
 
@@ -44,15 +48,58 @@ class LoggingConfig:
 
 _config_lock = RLock()
 _config: LoggingConfig | None = None
-_listener: QueueListener | None = None
+# Read without the lock in get_logger; only written while holding it.
+_initialized = False
+_listener: BatchingQueueListener | None = None
 _queue: SimpleQueue | None = None
+# Handlers init_logging attached to the root logger (the QueueHandler, or the
+# sinks themselves when queueing is off); the only root handlers closed on
+# teardown.
+_root_handlers: list[logging.Handler] = []
 _context_filter = ContextFilter()
+_atexit_registered = False
+# Loggers are never removed from logging's manager, so memoising the lookup
+# is safe and skips the manager lock taken by ``logging.getLogger``.
+_logger_for = lru_cache(maxsize=None)(logging.getLogger)
+
+
+_LEVELS = logging.getLevelNamesMapping()
 
 
 def _parse_level(level: str | int) -> int:
     if isinstance(level, int):
         return level
-    return getattr(logging, str(level).upper(), logging.INFO)
+    return _LEVELS.get(str(level).upper(), logging.INFO)
+
+
+class CachedTimeFormatter(logging.Formatter):
+    """Formatter that renders ``asctime`` at most once per second.
+
+    Only used with an explicit second-resolution ``datefmt``; the default
+    format includes milliseconds and falls through to the base class.
+    """
+
+    def __init__(self, *args: object, **kwargs: object) -> None:
+        super().__init__(*args, **kwargs)  # type: ignore[arg-type]
+        self._cached_time: tuple[int, str] = (-1, "")
+
+    def formatTime(  # noqa: N802 - logging API name
+        self, record: logging.LogRecord, datefmt: str | None = None
+    ) -> str:
+        if not datefmt:
+            return super().formatTime(record, datefmt)
+        second = int(record.created)
+        cached_second, cached = self._cached_time
+        if second != cached_second:
+            cached = time.strftime(datefmt, self.converter(second))
+            self._cached_time = (second, cached)
+        return cached
+
+
+def _midnight_after(day: date) -> float:
+    """Return the local epoch timestamp at which ``day`` ends."""
+
+    return datetime.combine(day + timedelta(days=1), datetime.min.time()).timestamp()
 
 
 class DailyFileHandler(logging.FileHandler):
@@ -69,8 +116,13 @@ class DailyFileHandler(logging.FileHandler):
         self.date_format = date_format
         self.directory.mkdir(parents=True, exist_ok=True)
         self._current_date: date = datetime.now().date()
+        self._next_rollover = _midnight_after(self._current_date)
+        # File names keyed by date ordinal; only the last few days are kept.
+        self._paths: dict[int, str] = {
+            self._current_date.toordinal(): os.fspath(self._path_for_date(self._current_date))
+        }
         super().__init__(
-            self._path_for_date(self._current_date),
+            self._paths[self._current_date.toordinal()],
             mode="a",
             encoding=encoding,
         )
@@ -78,25 +130,126 @@ class DailyFileHandler(logging.FileHandler):
     def _path_for_date(self, target_date: date) -> Path:
         return self.directory / f"{target_date.strftime(self.date_format)}.log"
 
+    def _path_for_ordinal(self, ordinal: int) -> str:
+        path = self._paths.get(ordinal)
+        if path is None:
+            path = os.fspath(self._path_for_date(date.fromordinal(ordinal)))
+            self._paths[ordinal] = path
+            for stale in [key for key in self._paths if key < ordinal - 3]:
+                del self._paths[stale]
+        return path
+
     def _switch_file(self) -> None:
         if self.stream:
             try:
                 self.stream.flush()
             finally:
                 self.stream.close()
-        self.baseFilename = os.fspath(self._path_for_date(self._current_date))
+        self.baseFilename = self._path_for_ordinal(self._current_date.toordinal())
         self.stream = self._open()
 
+    def _roll_over(self, created: float) -> None:
+        self._current_date = datetime.fromtimestamp(created).date()
+        self._next_rollover = _midnight_after(self._current_date)
+        self._switch_file()
+
     def emit(self, record: logging.LogRecord) -> None:
-        record_date = datetime.fromtimestamp(record.created).date()
-        if record_date != self._current_date:
-            self._current_date = record_date
-            self._switch_file()
+        if record.created >= self._next_rollover:
+            self._roll_over(record.created)
         super().emit(record)
 
+    def emit_batch(self, records: list[logging.LogRecord]) -> None:
+        """Write several records with one ``write`` and one flush.
+
+        Records are split at day boundaries so each lands in its own file.
+        """
+
+        pending: list[str] = []
+        with self.lock:
+            if self.stream is None:
+                self.stream = self._open()
+            for record in records:
+                if not self.filter(record):
+                    continue
+                try:
+                    if record.created >= self._next_rollover:
+                        if pending:
+                            self.stream.write("".join(pending))
+                            pending.clear()
+                        self._roll_over(record.created)
+                    pending.append(self.format(record) + self.terminator)
+                except Exception:
+                    self.handleError(record)
+            if pending:
+                try:
+                    self.stream.write("".join(pending))
+                    self.flush()
+                except Exception:
+                    self.handleError(records[-1])
+
+
+class BatchingQueueListener(QueueListener):
+    """Queue listener that drains bursts of records before dispatching.
+
+    Handlers exposing ``emit_batch`` receive the whole burst at once; other
+    handlers are called per record as usual.
+    """
+
+    max_batch: int = 256
+
+    def _dispatch(self, records: list[logging.LogRecord]) -> None:
+        prepared = [self.prepare(record) for record in records]
+        for handler in self.handlers:
+            if self.respect_handler_level:
+                batch = [r for r in prepared if r.levelno >= handler.level]
+            else:
+                batch = prepared
+            if not batch:
+                continue
+            emit_batch = getattr(handler, "emit_batch", None)
+            if emit_batch is not None:
+                emit_batch(batch)
+            else:
+                for record in batch:
+                    handler.handle(record)
+
+    def _monitor(self) -> None:
+        q = self.queue
+        has_task_done = hasattr(q, "task_done")
+        # Bound once: the drain loop calls it per queued record, and on a
+        # SimpleQueue it is a C call that never touches a Python-level lock.
+        get_nowait = q.get_nowait
+        sentinel = self._sentinel
+        max_batch = self.max_batch
+        stop = False
+        while not stop:
+            batch: list[logging.LogRecord] = []
+            record = self.dequeue(True)
+            dequeued = 1
+            while True:
+                if record is sentinel:
+                    stop = True
+                    break
+                batch.append(record)
+                if len(batch) >= max_batch:
+                    break
+                try:
+                    record = get_nowait()
+                except Empty:
+                    break
+                dequeued += 1
+            if batch:
+                self._dispatch(batch)
+            if has_task_done:
+                for _ in range(dequeued):
+                    q.task_done()
+
 
 def _build_handlers(cfg: LoggingConfig, level: int) -> list[logging.Handler]:
     handlers: list[logging.Handler] = []
+    # With a queue, the QueueHandler stamps ``record.context`` in the calling
+    # thread and the copied record keeps it, so the sinks need no filter.
+    attach_context = not cfg.queue
 
     if cfg.rich_tracebacks:
         install_rich_traceback(show_locals=False)
@@ -115,7 +268,8 @@ def _build_handlers(cfg: LoggingConfig, level: int) -> list[logging.Handler]:
         )
         rich_handler.setLevel(level)
         rich_handler.setFormatter(logging.Formatter("%(context)s%(message)s"))
-        rich_handler.addFilter(_context_filter)
+        if attach_context:
+            rich_handler.addFilter(_context_filter)
         handlers.append(rich_handler)
 
     if cfg.log_dir:
@@ -123,12 +277,13 @@ def _build_handlers(cfg: LoggingConfig, level: int) -> list[logging.Handler]:
         file_handler = DailyFileHandler(log_dir)
         file_handler.setLevel(level)
         file_handler.setFormatter(
-            logging.Formatter(
+            CachedTimeFormatter(
                 "%(asctime)s | %(levelname)-8s | %(name)s | %(context)s%(message)s",
                 datefmt="%Y-%m-%d %H:%M:%S",
             )
         )
-        file_handler.addFilter(_context_filter)
+        if attach_context:
+            file_handler.addFilter(_context_filter)
         handlers.append(file_handler)
 
     return handlers
@@ -143,7 +298,7 @@ def init_logging(**kwargs: object) -> None:
     """
 
     with _config_lock:
-        global _config, _listener, _queue
+        global _config, _listener, _queue, _initialized, _atexit_registered, _root_handlers
 
         cfg = LoggingConfig()
         for key, value in kwargs.items():
@@ -158,8 +313,7 @@ def init_logging(**kwargs: object) -> None:
 
         root = logging.getLogger()
         root.setLevel(logging.NOTSET)
-        for handler in list(root.handlers):
-            root.removeHandler(handler)
+        root.handlers.clear()
 
         handlers = _build_handlers(cfg, level)
 
@@ -169,29 +323,44 @@ def init_logging(**kwargs: object) -> None:
             queue_handler.setLevel(level)
             queue_handler.addFilter(_context_filter)
             root.addHandler(queue_handler)
-            listener = QueueListener(log_queue, *handlers, respect_handler_level=True)
+            _root_handlers = [queue_handler]
+            listener = BatchingQueueListener(
+                log_queue, *handlers, respect_handler_level=True
+            )
             listener.start()
             _queue = log_queue
             _listener = listener
+            if not _atexit_registered:
+                # The listener thread is a daemon; drain it before exit so
+                # records still queued at shutdown reach the sinks.
+                atexit.register(shutdown_logging)
+                _atexit_registered = True
         else:
             for handler in handlers:
                 root.addHandler(handler)
+            _root_handlers = handlers
 
         _config = cfg
+        _initialized = True
 
 
 def _teardown_locked() -> None:
-    global _listener, _queue, _config
+    global _listener, _queue, _config, _initialized, _root_handlers
+    _initialized = False
+    # Only handlers this module created are closed; foreign root handlers
+    # (basicConfig, pytest's caplog) are detached but left usable.
+    owned: list[logging.Handler] = list(_root_handlers)
     if _listener:
         _listener.stop()
+        owned.extend(handler for handler in _listener.handlers if handler not in owned)
     _listener = None
     _queue = None
     _config = None
+    _root_handlers = []
     progress_manager.reset_console()
-    root = logging.getLogger()
-    for handler in list(root.handlers):
-        root.removeHandler(handler)
-    root.handlers.clear()
+    logging.getLogger().handlers.clear()
+    for handler in owned:
+        handler.close()
 
 
 def shutdown_logging() -> None:
@@ -202,11 +371,14 @@ def shutdown_logging() -> None:
 
 
 def get_logger(name: str | None = None) -> logging.Logger:
-    with _config_lock:
-        if _config is None:
-            init_logging()
+    if not _initialized:
+        with _config_lock:
+            if _config is None:
+                init_logging()
+    if name:
+        return _logger_for(name)
     cfg = _config or LoggingConfig()
-    return logging.getLogger(name or cfg.app_name)
+    return _logger_for(cfg.app_name)
 
 
 def set_level(level: str | int) -> None:
@@ -6,42 +6,49 @@ import contextvars
 import logging
 from typing import Dict
 
+# The ContextVar holds the bound values together with their rendered
+# ``k=v `` prefix, so the filter does no formatting work per record.
+_EMPTY: tuple[dict[str, object], str] = ({}, "")
 
-_context_var: contextvars.ContextVar[dict[str, object]] = contextvars.ContextVar(
-    "log_context", default={}
+_context_var: contextvars.ContextVar[tuple[dict[str, object], str]] = (
+    contextvars.ContextVar("log_context", default=_EMPTY)
 )
 
 
+def _set_context(values: dict[str, object]) -> None:
+    if not values:
+        _context_var.set(_EMPTY)
+        return
+    rendered = " ".join(f"{k}={v}" for k, v in values.items()) + " "
+    _context_var.set((values, rendered))
+
+
 class LogContext:
     """Utility to bind contextual information to subsequent log records."""
 
     def bind(self, **values: object) -> None:
-        current = dict(_context_var.get())
+        current = dict(_context_var.get()[0])
         current.update({k: v for k, v in values.items() if v is not None})
-        _context_var.set(current)
+        _set_context(current)
 
     def unbind(self, *keys: str) -> None:
-        current = dict(_context_var.get())
+        current = dict(_context_var.get()[0])
         for key in keys:
             current.pop(key, None)
-        _context_var.set(current)
+        _set_context(current)
 
     def clear(self) -> None:
-        _context_var.set({})
+        _context_var.set(_EMPTY)
 
     def as_dict(self) -> Dict[str, object]:
-        return dict(_context_var.get())
+        return dict(_context_var.get()[0])
 
 
 class ContextFilter(logging.Filter):
     """Attach contextual key-value pairs to log records."""
 
     def filter(self, record: logging.LogRecord) -> bool:
-        context = _context_var.get()
-        if context:
-            record.context = " ".join(f"{k}={v}" for k, v in context.items()) + " "
-        else:
-            record.context = ""
+        record.context = _context_var.get()[1]
         return True
 
 
@@ -4,6 +4,7 @@ from __future__ import annotations
 
 from contextlib import contextmanager
 from dataclasses import dataclass
+from time import perf_counter
 from typing import Iterable, Iterator, Optional
 
 from rich.console import Console
@@ -36,6 +37,21 @@ class _Task:
         self.progress.update(self.task_id, **kwargs)
 
 
+class _NullTask:
+    """Stand-in for :class:`_Task` when no progress bar is rendered."""
+
+    __slots__ = ()
+
+    def advance(self, amount: float = 1.0) -> None:
+        pass
+
+    def update(self, **kwargs: object) -> None:
+        pass
+
+
+_NULL_TASK = _NullTask()
+
+
 class _RateColumn(ProgressColumn):
     """Display task throughput with backwards-compatible Rich versions."""
 
@@ -84,7 +100,12 @@ class ProgressManager:
         *,
         total: Optional[float] = None,
         unit: str = "items",
-    ) -> Iterator[_Task]:
+    ) -> Iterator[_Task | _NullTask]:
+        if not self._console.is_terminal:
+            # Nothing would be drawn (CI, redirected output), so skip building
+            # the Progress instance and its refresh thread entirely.
+            yield _NULL_TASK
+            return
         progress = Progress(*self._columns(unit), console=self._console, transient=True)
         with progress:
             task_id = progress.add_task(description, total=total)
@@ -97,14 +118,35 @@ class ProgressManager:
         description: str,
         total: Optional[int] = None,
         unit: str = "items",
+        batch: int = 1000,
+        interval: float = 0.05,
     ) -> Iterator[object]:
+        """Yield from ``iterable`` while advancing a progress bar.
+
+        Advances are accumulated and pushed to the bar every ``batch`` items
+        or ``interval`` seconds, whichever comes first.
+        """
+
         with self.task(description, total=total, unit=unit) as task:
-            for item in iterable:
-                yield item
-                task.advance(1)
+            pending = 0
+            deadline = perf_counter() + interval
+            try:
+                for item in iterable:
+                    yield item
+                    pending += 1
+                    if pending >= batch or perf_counter() >= deadline:
+                        task.advance(pending)
+                        pending = 0
+                        deadline = perf_counter() + interval
+            finally:
+                if pending:
+                    task.advance(pending)
 
     @contextmanager
     def spinner(self, description: str) -> Iterator[None]:
+        if not self._console.is_terminal:
+            yield
+            return
         progress = Progress(
             SpinnerColumn(),
             TextColumn("[bold blue]{task.description}[/]"),
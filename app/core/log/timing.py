@@ -8,6 +8,7 @@ from dataclasses import dataclass, field
 from time import perf_counter
 from typing import Any, Optional
 
+from sqlalchemy import event
 from sqlalchemy.orm import Session
 
 
@@ -16,43 +17,24 @@ class DatabaseCallTracker:
 
     def __init__(self) -> None:
         self.call_count = 0
-        self.original_execute = None
-        self.original_scalar = None
-        self.original_scalars = None
+        self._session: Optional[Session] = None
 
-    def track_calls(self, session: Session) -> Session:
-        """Wrap session methods to track database calls."""
-        if not hasattr(session, '_call_tracker'):
-            # Store original methods
-            self.original_execute = session.execute
-            self.original_scalar = session.scalar
-            self.original_scalars = session.scalars
-
-            # Wrap execute method
-            def tracked_execute(*args, **kwargs):
-                self.call_count += 1
-                return self.original_execute(*args, **kwargs)
-
-            # Wrap scalar method
-            def tracked_scalar(*args, **kwargs):
-                self.call_count += 1
-                return self.original_scalar(*args, **kwargs)
-
-            # Wrap scalars method
-            def tracked_scalars(*args, **kwargs):
-                self.call_count += 1
-                return self.original_scalars(*args, **kwargs)
-
-            # Replace methods
-            session.execute = tracked_execute
-            session.scalar = tracked_scalar
-            session.scalars = tracked_scalars
-
-            # Mark as tracked
-            session._call_tracker = self
+    def _on_execute(self, orm_execute_state: Any) -> None:
+        self.call_count += 1
 
+    def track_calls(self, session: Session) -> Session:
+        """Count statements executed through ``session`` until :meth:`stop`."""
+        if self._session is None:
+            event.listen(session, "do_orm_execute", self._on_execute)
+            self._session = session
         return session
 
+    def stop(self) -> None:
+        """Detach the listener registered by :meth:`track_calls`."""
+        if self._session is not None:
+            event.remove(self._session, "do_orm_execute", self._on_execute)
+            self._session = None
+
 
 @dataclass
 class _Timer:
@@ -157,3 +139,8 @@ def timeit(
         raise
     else:
         timer.finish(success=True)
+    finally:
+        # Also reached on BaseException (cancellation, KeyboardInterrupt,
+        # GeneratorExit), so the listener never outlives the block.
+        if db_tracker is not None:
+            db_tracker.stop()
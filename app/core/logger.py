@@ -2,22 +2,7 @@
 """Compatibility wrapper that exposes the shared logging utilities."""
 from __future__ import annotations
 
-from .log import (
-    get_logger,
-    init_logging,
-    log_context,
-    progress_manager,
-    set_level,
-    shutdown_logging,
-    timeit,
-)
-
-__all__ = [
-    "get_logger",
-    "init_logging",
-    "set_level",
-    "shutdown_logging",
-    "log_context",
-    "progress_manager",
-    "timeit",
-]
+# Re-export exactly the public names of ``app.core.log`` so the two lists
+# cannot drift apart.
+from .log import *  # noqa: F401,F403
+from .log import __all__  # noqa: F401
@@ -1,25 +1,59 @@
 """Simple JWT-backed authentication helpers used by the demo."""
 from __future__ import annotations
 
-from dataclasses import dataclass
-from datetime import date, datetime, timedelta, timezone
+import base64
+import binascii
+import hashlib
+import hmac
+import json
+import time
+from collections import OrderedDict
+from collections.abc import Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from datetime import date
 from functools import lru_cache
+from threading import Lock
 
 import jwt
-from fastapi import Depends, HTTPException, Request, status
+from fastapi import Depends, HTTPException, status
 from jwt import ExpiredSignatureError, InvalidTokenError
+from jwt.algorithms import HMACAlgorithm, get_default_algorithms
 
 from app.core.config import AuthSettings, get_settings
 from app.db.session import get_sessionmaker
 from app.models import (
     AppUser,
+    AppUserRole,
     CompanyAccessGrant,
     EmploymentContract,
     OrgPartyMap,
     UserPartyMap,
 )
-from sqlalchemy import or_, select
-from sqlalchemy.orm import selectinload
+from sqlalchemy import (
+    BigInteger,
+    String,
+    and_,
+    cast,
+    literal,
+    null,
+    or_,
+    select,
+    union_all,
+)
+
+
+def _digest(value: str) -> bytes:
+    return hashlib.sha256(value.encode("utf-8")).digest()
+
+
+def _b64url(data: bytes) -> bytes:
+    return base64.urlsafe_b64encode(data).rstrip(b"=")
+
+
+def _b64url_decode(data: bytes) -> bytes:
+    return base64.urlsafe_b64decode(data + b"=" * (-len(data) % 4))
 
 
 class AuthenticationError(Exception):
@@ -37,127 +71,144 @@ class AuthenticatedUser:
     party_id: int | None = None
     roles: tuple[str, ...] = ()
     company_ids: tuple[int, ...] = ()
+    # Derived once so the access dependencies need a single check per request.
+    _company_set: frozenset[int] = field(init=False, repr=False, compare=False)
+    _is_admin: bool = field(init=False, repr=False, compare=False)
 
+    def __post_init__(self) -> None:
+        object.__setattr__(self, "_company_set", frozenset(self.company_ids))
+        object.__setattr__(self, "_is_admin", self.role == "admin" or "ADMIN" in self.roles)
 
-class SecurityProvider:
-    """Authenticate demo users and issue/verify JWT access tokens."""
 
-    def __init__(self, settings: AuthSettings, session_factory=None) -> None:
-        self._settings = settings
-        self._session_factory = session_factory or get_sessionmaker()
+class _TokenCache:
+    """Thread-safe LRU of verified tokens, keyed by token digest."""
+
+    def __init__(self, maxsize: int) -> None:
+        self._maxsize = maxsize
+        self._entries: OrderedDict[bytes, tuple[AuthenticatedUser, float | None]] = OrderedDict()
+        self._lock = Lock()
+
+    def get(self, key: bytes) -> tuple[AuthenticatedUser, float | None] | None:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+            return entry
 
-    @property
-    def cookie_name(self) -> str:
-        """Return the cookie name used for the access token."""
+    def put(self, key: bytes, entry: tuple[AuthenticatedUser, float | None]) -> None:
+        with self._lock:
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            if len(self._entries) > self._maxsize:
+                self._entries.popitem(last=False)
 
-        return self._settings.cookie_name
+    def discard(self, key: bytes) -> None:
+        with self._lock:
+            self._entries.pop(key, None)
 
-    @property
-    def token_ttl_seconds(self) -> int:
-        """Return the access token lifetime in seconds."""
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+
+_token_cache = _TokenCache(maxsize=4096)
+
+# User resolved by AuthMiddleware for the request being served; set and reset
+# around the downstream app so it never leaks between requests.
+_request_user: ContextVar[AuthenticatedUser | None] = ContextVar(
+    "finance_request_user", default=None
+)
 
-        return int(self._settings.access_token_expire_minutes * 60)
 
-    @property
-    def admin_username(self) -> str:
-        return self._settings.admin_username
+class SecurityProvider:
+    """Authenticate demo users and issue/verify JWT access tokens."""
 
-    @property
-    def demo_user_password(self) -> str:
-        return self._settings.demo_user_password
+    def __init__(self, settings: AuthSettings, session_factory=None) -> None:
+        self._settings = settings
+        self._session_factory = session_factory or get_sessionmaker()
+        # Settings are immutable for the provider's lifetime, so the values read
+        # on every request are copied into plain attributes once.
+        self.cookie_name: str = settings.cookie_name
+        self.token_ttl_seconds: int = int(settings.access_token_expire_minutes * 60)
+        self.admin_username: str = settings.admin_username
+        self.demo_user_password: str = settings.demo_user_password
+        # Credentials are compared as fixed-length SHA-256 digests with
+        # hmac.compare_digest so timing does not reveal matching prefixes.
+        self._admin_user_digest = _digest(settings.admin_username)
+        self._admin_password_digest = _digest(settings.admin_password)
+        self._demo_password_digest = _digest(settings.demo_user_password)
+        self._secret_key = settings.secret_key
+        self._algorithm = settings.algorithm
+        # Verified tokens are cached under a BLAKE2b digest keyed by the signing
+        # settings, so raw bearer tokens are never held as cache keys.
+        self._token_cache_key = hashlib.sha256(
+            f"{settings.algorithm}:{settings.secret_key}".encode("utf-8")
+        ).digest()
+        # HMAC tokens (HS256/384/512) are assembled by hand: PyJWT's algorithm
+        # object is resolved once, and the header, which never changes, is
+        # serialised exactly as PyJWT would (sorted keys, compact separators).
+        self._jwt_header_b64: bytes | None = None
+        # Arguments for the PyJWT fallback path, derived once rather than per
+        # decode: the algorithm allow-list and, for HMAC, the prepared key.
+        self._decode_algorithms: tuple[str, ...] = (settings.algorithm,)
+        self._decode_key: str | bytes = settings.secret_key
+        algorithm_impl = get_default_algorithms().get(settings.algorithm)
+        if isinstance(algorithm_impl, HMACAlgorithm):
+            self._decode_key = algorithm_impl.prepare_key(settings.secret_key)
+            header = json.dumps(
+                {"alg": settings.algorithm, "typ": "JWT"}, separators=(",", ":"), sort_keys=True
+            )
+            self._jwt_header_b64 = _b64url(header.encode("utf-8"))
+            # Keyed once; copy() clones the inner/outer digest state so each
+            # token skips the key padding work.
+            self._jwt_hmac = hmac.new(self._decode_key, None, algorithm_impl.hash_alg)
 
     def authenticate(self, username: str, password: str) -> AuthenticatedUser | None:
         """Validate the supplied credentials and return an ``AuthenticatedUser``."""
 
-        # Check admin authentication first
-        if (
-            username == self._settings.admin_username
-            and password == self._settings.admin_password
-        ):
+        password_digest = _digest(password)
+
+        # Check admin authentication first; ``&`` avoids short-circuiting so
+        # both comparisons always run.
+        is_admin = hmac.compare_digest(
+            _digest(username), self._admin_user_digest
+        ) & hmac.compare_digest(password_digest, self._admin_password_digest)
+        if is_admin:
             return AuthenticatedUser(username=username, role="admin")
 
         # Check demo password for all other accounts
-        if password != self._settings.demo_user_password:
+        if not hmac.compare_digest(password_digest, self._demo_password_digest):
             return None
 
         with self._session_factory() as session:
-            base_query = select(AppUser).options(selectinload(AppUser.roles))
-            app_user = session.execute(base_query.where(AppUser.username == username)).scalars().first()
+            user_columns = select(
+                AppUser.id, AppUser.username, AppUser.is_active, AppUser.party_id
+            )
+            app_user = session.execute(user_columns.where(AppUser.username == username)).first()
 
             fallback_user_id: int | None = None
 
             if not app_user and username.startswith("u") and username[1:].isdigit():
                 fallback_user_id = int(username[1:])
-                mapped_party_id = (
-                    session.execute(
-                        select(UserPartyMap.party_id).where(UserPartyMap.user_id == fallback_user_id)
-                    )
-                    .scalar_one_or_none()
+                mapped_party = (
+                    select(UserPartyMap.party_id)
+                    .where(UserPartyMap.user_id == fallback_user_id)
+                    .scalar_subquery()
                 )
-                if mapped_party_id is not None:
-                    app_user = (
-                        session.execute(base_query.where(AppUser.party_id == mapped_party_id))
-                        .scalars()
-                        .first()
-                    )
+                app_user = session.execute(
+                    user_columns.where(AppUser.party_id == mapped_party)
+                ).first()
 
             if not app_user or not app_user.is_active:
                 return None
 
-            role_codes = tuple(sorted(role.role_code for role in app_user.roles))
             party_id = app_user.party_id
-
-            individual_id = None
-            if party_id is not None:
-                individual_id = (
-                    session.execute(
-                        select(UserPartyMap.user_id).where(UserPartyMap.party_id == party_id)
-                    ).scalar_one_or_none()
-                )
+            role_codes, individual_id, company_ids = self._load_claims(
+                session, app_user.id, party_id
+            )
             if individual_id is None and fallback_user_id is not None:
                 individual_id = fallback_user_id
 
-            company_ids: set[int] = set()
-            if party_id is not None:
-                employment_rows = session.execute(
-                    select(
-                        EmploymentContract.employer_party_id.label("employer_party_id"),
-                        OrgPartyMap.org_id.label("company_id"),
-                    )
-                    .outerjoin(OrgPartyMap, OrgPartyMap.party_id == EmploymentContract.employer_party_id)
-                    .where(
-                        EmploymentContract.employee_party_id == party_id,
-                        EmploymentContract.start_date <= date.today(),
-                        or_(
-                            EmploymentContract.end_date.is_(None),
-                            EmploymentContract.end_date >= date.today(),
-                        ),
-                    )
-                ).all()
-                for row in employment_rows:
-                    if row.company_id is not None:
-                        company_ids.add(int(row.company_id))
-                    if row.employer_party_id is not None:
-                        company_ids.add(int(row.employer_party_id))
-
-            if "ADMIN" not in role_codes:
-                grant_rows = session.execute(
-                    select(OrgPartyMap.org_id)
-                    .join(
-                        EmploymentContract,
-                        EmploymentContract.employer_party_id == OrgPartyMap.party_id,
-                    )
-                    .join(
-                        CompanyAccessGrant,
-                        CompanyAccessGrant.contract_id == EmploymentContract.id,
-                    )
-                    .where(
-                        CompanyAccessGrant.app_user_id == app_user.id,
-                        CompanyAccessGrant.revoked_at.is_(None),
-                    )
-                ).scalars()
-                company_ids.update(grant_rows)
-
             # Fall back to individual role when no admin privileges present
             resolved_role = "admin" if "ADMIN" in role_codes else "individual"
             subject_id = individual_id
@@ -172,16 +223,82 @@ class SecurityProvider:
                 company_ids=tuple(sorted(company_ids)),
             )
 
+    @staticmethod
+    def _load_claims(
+        session, app_user_id: int, party_id: int | None
+    ) -> tuple[tuple[str, ...], int | None, set[int]]:
+        """Fetch roles, individual id and company ids in a single round-trip.
+
+        Each branch of the ``UNION ALL`` tags its rows with a ``kind`` so the
+        results can be split again in Python.
+        """
+
+        no_code = cast(null(), String)
+        no_ref = cast(null(), BigInteger)
+        today = date.today()
+        active_contract = and_(
+            EmploymentContract.start_date <= today,
+            or_(EmploymentContract.end_date.is_(None), EmploymentContract.end_date >= today),
+        )
+
+        branches = [
+            select(
+                literal("role").label("kind"),
+                AppUserRole.role_code.label("code"),
+                no_ref.label("ref_id"),
+            ).where(AppUserRole.app_user_id == app_user_id),
+            select(literal("grant"), no_code, OrgPartyMap.org_id)
+            .join(EmploymentContract, EmploymentContract.employer_party_id == OrgPartyMap.party_id)
+            .join(CompanyAccessGrant, CompanyAccessGrant.contract_id == EmploymentContract.id)
+            .where(
+                CompanyAccessGrant.app_user_id == app_user_id,
+                CompanyAccessGrant.revoked_at.is_(None),
+            ),
+        ]
+        if party_id is not None:
+            branches += [
+                select(literal("individual"), no_code, UserPartyMap.user_id).where(
+                    UserPartyMap.party_id == party_id
+                ),
+                select(literal("employer"), no_code, EmploymentContract.employer_party_id).where(
+                    EmploymentContract.employee_party_id == party_id, active_contract
+                ),
+                select(literal("company"), no_code, OrgPartyMap.org_id)
+                .join(EmploymentContract, EmploymentContract.employer_party_id == OrgPartyMap.party_id)
+                .where(EmploymentContract.employee_party_id == party_id, active_contract),
+            ]
+
+        roles: list[str] = []
+        individual_id: int | None = None
+        company_ids: set[int] = set()
+        grant_ids: set[int] = set()
+        for kind, code, ref_id in session.execute(union_all(*branches)):
+            if kind == "role":
+                roles.append(code)
+            elif ref_id is None:
+                continue
+            elif kind == "individual":
+                if individual_id is None:
+                    individual_id = int(ref_id)
+            elif kind == "grant":
+                grant_ids.add(int(ref_id))
+            else:
+                company_ids.add(int(ref_id))
+
+        role_codes = tuple(sorted(roles))
+        if "ADMIN" not in role_codes:
+            company_ids |= grant_ids
+        return role_codes, individual_id, company_ids
+
     def create_access_token(self, user: AuthenticatedUser) -> str:
         """Create a signed JWT for the authenticated user."""
 
-        now = datetime.now(tz=timezone.utc)
-        expires = now + timedelta(minutes=self._settings.access_token_expire_minutes)
+        issued_at = int(time.time())
         payload: dict[str, object] = {
             "sub": user.username,
             "role": user.role,
-            "iat": int(now.timestamp()),
-            "exp": int(expires.timestamp()),
+            "iat": issued_at,
+            "exp": issued_at + self.token_ttl_seconds,
         }
         if user.subject_id is not None:
             payload["subject_id"] = user.subject_id
@@ -193,77 +310,178 @@ class SecurityProvider:
             payload["roles"] = list(user.roles)
         if user.company_ids:
             payload["company_ids"] = list(user.company_ids)
-        token = jwt.encode(payload, self._settings.secret_key, algorithm=self._settings.algorithm)
-        return token
+        if self._jwt_header_b64 is None:
+            return jwt.encode(payload, self._secret_key, algorithm=self._algorithm)
+
+        payload_json = json.dumps(payload, separators=(",", ":")).encode("utf-8")
+        signing_input = self._jwt_header_b64 + b"." + _b64url(payload_json)
+        mac = self._jwt_hmac.copy()
+        mac.update(signing_input)
+        signature = mac.digest()
+        return (signing_input + b"." + _b64url(signature)).decode("ascii")
+
+    def _verify_own_token(self, token: str) -> dict[str, object] | None:
+        """Verify an HMAC token carrying exactly the header this provider issues.
+
+        Returns ``None`` for any other shape (different header, ``nbf``/``aud``
+        claims) so the caller falls back to ``jwt.decode``.
+        """
+
+        raw = token.encode("utf-8")
+        header_b64, _, rest = raw.partition(b".")
+        if header_b64 != self._jwt_header_b64:
+            return None
+        payload_b64, dot, signature_b64 = rest.partition(b".")
+        if not dot or b"." in signature_b64:
+            raise AuthenticationError("Invalid token")
 
-    def decode_token(self, token: str) -> AuthenticatedUser:
-        """Decode a JWT and return the corresponding ``AuthenticatedUser``."""
+        mac = self._jwt_hmac.copy()
+        mac.update(raw[: len(header_b64) + 1 + len(payload_b64)])
+        try:
+            signature = _b64url_decode(signature_b64)
+        except (binascii.Error, ValueError) as exc:
+            raise AuthenticationError("Invalid token") from exc
+        if not hmac.compare_digest(mac.digest(), signature):
+            raise AuthenticationError("Invalid token")
 
         try:
-            payload = jwt.decode(
-                token,
-                self._settings.secret_key,
-                algorithms=[self._settings.algorithm],
-            )
-        except ExpiredSignatureError as exc:  # pragma: no cover - runtime safeguard
-            raise AuthenticationError("Token expired") from exc
-        except InvalidTokenError as exc:  # pragma: no cover - runtime safeguard
+            payload = json.loads(_b64url_decode(payload_b64))
+        except (binascii.Error, ValueError) as exc:
             raise AuthenticationError("Invalid token") from exc
+        if not isinstance(payload, dict):
+            raise AuthenticationError("Invalid token")
+        if "nbf" in payload or "aud" in payload:
+            return None
+        return payload
 
-        username = payload.get("sub")
-        role = payload.get("role")
-        subject_id = payload.get("subject_id")
-        if not isinstance(username, str) or not isinstance(role, str):
-            raise AuthenticationError("Token payload missing required claims")
+    def decode_token(self, token: str) -> AuthenticatedUser:
+        """Decode a JWT and return the corresponding ``AuthenticatedUser``.
+
+        Verified tokens are cached; only the expiry is re-checked on a hit.
+        """
+
+        key = hashlib.blake2b(
+            token.encode("utf-8"), digest_size=16, key=self._token_cache_key
+        ).digest()
+        entry = _token_cache.get(key)
+        if entry is None:
+            payload = self._verify_own_token(token) if self._jwt_header_b64 else None
+            if payload is not None:
+                entry = _claims_to_user(payload)
+            else:
+                entry = _decode_token(token, self._decode_key, self._decode_algorithms)
+            _token_cache.put(key, entry)
+        user, expires_at = entry
+        if expires_at is not None and expires_at <= time.time():
+            _token_cache.discard(key)
+            raise AuthenticationError("Token expired")
+        return user
 
-        resolved_subject: int | None = None
-        if subject_id is not None:
-            try:
-                resolved_subject = int(subject_id)
-            except (TypeError, ValueError) as exc:  # pragma: no cover - runtime safeguard
-                raise AuthenticationError("Token subject claim invalid") from exc
-        app_user_id = payload.get("app_user_id")
-        party_id = payload.get("party_id")
-        roles_payload = payload.get("roles")
-        company_ids_payload = payload.get("company_ids")
-
-        resolved_app_user: int | None = None
-        if app_user_id is not None:
-            try:
-                resolved_app_user = int(app_user_id)
-            except (TypeError, ValueError) as exc:  # pragma: no cover - runtime safeguard
-                raise AuthenticationError("Token app_user_id invalid") from exc
 
-        resolved_party: int | None = None
-        if party_id is not None:
+def _decode_token(
+    token: str, key: str | bytes, algorithms: tuple[str, ...]
+) -> tuple[AuthenticatedUser, float | None]:
+    """Verify ``token`` with PyJWT and build its user and ``exp`` claim."""
+
+    try:
+        payload = jwt.decode(token, key, algorithms=algorithms)
+    except ExpiredSignatureError as exc:  # pragma: no cover - runtime safeguard
+        raise AuthenticationError("Token expired") from exc
+    except InvalidTokenError as exc:  # pragma: no cover - runtime safeguard
+        raise AuthenticationError("Invalid token") from exc
+    return _claims_to_user(payload)
+
+
+def _claims_to_user(payload: dict[str, object]) -> tuple[AuthenticatedUser, float | None]:
+    """Build the ``AuthenticatedUser`` for verified claims, plus ``exp``."""
+
+    expires_at = payload.get("exp")
+    if expires_at is not None and (
+        isinstance(expires_at, bool) or not isinstance(expires_at, (int, float))
+    ):
+        raise AuthenticationError("Invalid token")
+
+    username = payload.get("sub")
+    role = payload.get("role")
+    subject_id = payload.get("subject_id")
+    if not isinstance(username, str) or not isinstance(role, str):
+        raise AuthenticationError("Token payload missing required claims")
+
+    resolved_subject: int | None = None
+    if subject_id is not None:
+        try:
+            resolved_subject = int(subject_id)
+        except (TypeError, ValueError) as exc:  # pragma: no cover - runtime safeguard
+            raise AuthenticationError("Token subject claim invalid") from exc
+    app_user_id = payload.get("app_user_id")
+    party_id = payload.get("party_id")
+    roles_payload = payload.get("roles")
+    company_ids_payload = payload.get("company_ids")
+
+    resolved_app_user: int | None = None
+    if app_user_id is not None:
+        try:
+            resolved_app_user = int(app_user_id)
+        except (TypeError, ValueError) as exc:  # pragma: no cover - runtime safeguard
+            raise AuthenticationError("Token app_user_id invalid") from exc
+
+    resolved_party: int | None = None
+    if party_id is not None:
+        try:
+            resolved_party = int(party_id)
+        except (TypeError, ValueError) as exc:  # pragma: no cover - runtime safeguard
+            raise AuthenticationError("Token party_id invalid") from exc
+
+    resolved_roles: tuple[str, ...] = ()
+    if isinstance(roles_payload, list) and all(isinstance(r, str) for r in roles_payload):
+        resolved_roles = tuple(roles_payload)
+
+    resolved_company_ids: tuple[int, ...] = ()
+    if isinstance(company_ids_payload, list):
+        company_values: list[int] = []
+        for value in company_ids_payload:
             try:
-                resolved_party = int(party_id)
+                company_values.append(int(value))
             except (TypeError, ValueError) as exc:  # pragma: no cover - runtime safeguard
-                raise AuthenticationError("Token party_id invalid") from exc
-
-        resolved_roles: tuple[str, ...] = ()
-        if isinstance(roles_payload, list) and all(isinstance(r, str) for r in roles_payload):
-            resolved_roles = tuple(roles_payload)
-
-        resolved_company_ids: tuple[int, ...] = ()
-        if isinstance(company_ids_payload, list):
-            company_values: list[int] = []
-            for value in company_ids_payload:
-                try:
-                    company_values.append(int(value))
-                except (TypeError, ValueError) as exc:  # pragma: no cover - runtime safeguard
-                    raise AuthenticationError("Token company_ids invalid") from exc
-            resolved_company_ids = tuple(sorted(set(company_values)))
-
-        return AuthenticatedUser(
-            username=username,
-            role=role,
-            subject_id=resolved_subject,
-            app_user_id=resolved_app_user,
-            party_id=resolved_party,
-            roles=resolved_roles,
-            company_ids=resolved_company_ids,
-        )
+                raise AuthenticationError("Token company_ids invalid") from exc
+        resolved_company_ids = tuple(sorted(set(company_values)))
+
+    user = AuthenticatedUser(
+        username=username,
+        role=role,
+        subject_id=resolved_subject,
+        app_user_id=resolved_app_user,
+        party_id=resolved_party,
+        roles=resolved_roles,
+        company_ids=resolved_company_ids,
+    )
+    return user, None if expires_at is None else float(expires_at)
+
+
+def clear_decode_cache() -> None:
+    """Forget memoised tokens, e.g. after rotating the signing key."""
+
+    _token_cache.clear()
+
+
+@contextmanager
+def authenticated_user_context(user: AuthenticatedUser | None) -> Iterator[None]:
+    """Make ``user`` the current request's user for the duration of the block."""
+
+    token = _request_user.set(user)
+    try:
+        yield
+    finally:
+        _request_user.reset(token)
+
+
+def current_user() -> AuthenticatedUser | None:
+    """Return the user :class:`~app.middleware.auth.AuthMiddleware` resolved.
+
+    ``None`` for anonymous requests and outside a request.
+    """
+
+    return _request_user.get()
 
 
 @lru_cache(maxsize=1)
@@ -275,17 +493,16 @@ def get_security_provider() -> SecurityProvider:
     return SecurityProvider(settings.auth, session_factory)
 
 
-def get_authenticated_user(request: Request) -> AuthenticatedUser:
+async def get_authenticated_user() -> AuthenticatedUser:
     """Retrieve the authenticated user from the request context."""
 
-    security = get_security_provider()
-    user = getattr(request.state, "user", None)
+    user = current_user()
     if user is None:
         raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Login required")
     return user
 
 
-def require_admin_user(
+async def require_admin_user(
     user: AuthenticatedUser = Depends(get_authenticated_user),
 ) -> AuthenticatedUser:
     """Ensure the current user has administrative privileges."""
@@ -298,28 +515,24 @@ def require_admin_user(
     return user
 
 
-def require_individual_access(
+async def require_individual_access(
     user_id: int,
     user: AuthenticatedUser = Depends(get_authenticated_user),
 ) -> AuthenticatedUser:
     """Ensure the user can access the requested individual dashboard."""
 
-    if "ADMIN" in user.roles or user.role == "admin":
-        return user
-    if user.subject_id == user_id:
+    if user._is_admin or user.subject_id == user_id:
         return user
     raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Access denied")
 
 
-def require_company_access(
+async def require_company_access(
     company_id: int,
     user: AuthenticatedUser = Depends(get_authenticated_user),
 ) -> AuthenticatedUser:
     """Ensure the user can access the requested company dashboard."""
 
-    if "ADMIN" in user.roles or user.role == "admin":
-        return user
-    if company_id in user.company_ids:
+    if user._is_admin or company_id in user._company_set:
         return user
     raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Access denied")
 
@@ -328,6 +541,9 @@ __all__ = [
     "AuthenticatedUser",
     "AuthenticationError",
     "SecurityProvider",
+    "authenticated_user_context",
+    "clear_decode_cache",
+    "current_user",
     "get_security_provider",
     "get_authenticated_user",
     "require_admin_user",
@@ -1,6 +1,11 @@
 """Database engine factories."""
 from __future__ import annotations
 
+import logging
+from functools import lru_cache
+from threading import Lock
+from typing import Any
+
 from sqlalchemy import create_engine
 from sqlalchemy.engine import Engine
 
@@ -17,25 +22,62 @@ def get_sqlalchemy_url() -> str:
     return settings.database.sqlalchemy_url
 
 
-def create_sync_engine(url: str | None = None, **kwargs) -> Engine:
-    """Create a synchronous SQLAlchemy engine using configured defaults."""
+@lru_cache(maxsize=1)
+def _default_url() -> str:
+    # Settings are read from the environment once per process; engines are
+    # shared per URL anyway, so later env changes would not take effect.
+    return get_sqlalchemy_url()
 
-    settings = get_settings()
-    resolved_url = url or settings.database.sqlalchemy_url
-
-    options = dict(kwargs)
-
-    LOGGER.debug(
-        "Creating SQLAlchemy engine",
-        extra={
-            "url": {
-                "driver": settings.database.driver,
-                "host": settings.database.host,
-                "port": settings.database.port,
-                "name": settings.database.name,
-                "user": settings.database.user,
+
+def _build_engine(url: str, options: dict[str, Any]) -> Engine:
+    if LOGGER.isEnabledFor(logging.DEBUG):
+        settings = get_settings()
+        LOGGER.debug(
+            "Creating SQLAlchemy engine",
+            extra={
+                "url": {
+                    "driver": settings.database.driver,
+                    "host": settings.database.host,
+                    "port": settings.database.port,
+                    "name": settings.database.name,
+                    "user": settings.database.user,
+                },
+                "options": dict(options),
             },
-            "options": options,
-        },
-    )
-    return create_engine(resolved_url, future=True, **options)
+        )
+    return create_engine(url, future=True, **options)
+
+
+# Unbounded on purpose: an engine evicted from a bounded cache would keep its
+# pool open with nothing left to dispose it. Processes use a handful of URLs.
+_ENGINES: dict[tuple[str, tuple[tuple[str, Any], ...]], Engine] = {}
+_ENGINES_LOCK = Lock()
+
+
+def _shared_engine(url: str, options: tuple[tuple[str, Any], ...]) -> Engine:
+    key = (url, options)
+    engine = _ENGINES.get(key)
+    if engine is None:
+        with _ENGINES_LOCK:
+            engine = _ENGINES.get(key)
+            if engine is None:
+                engine = _build_engine(url, dict(options))
+                _ENGINES[key] = engine
+    return engine
+
+
+def create_sync_engine(url: str | None = None, **kwargs) -> Engine:
+    """Create a synchronous SQLAlchemy engine using configured defaults.
+
+    Engines are shared per URL and options so every caller reuses the same
+    connection pool. Options that cannot be hashed (e.g. a ``connect_args``
+    dict) get a dedicated engine.
+    """
+
+    resolved_url = url or _default_url()
+    options = tuple(sorted(kwargs.items()))
+    try:
+        hash(options)
+    except TypeError:
+        return _build_engine(resolved_url, dict(kwargs))
+    return _shared_engine(resolved_url, options)
@@ -1,21 +1,4 @@
 """Backwards-compatible logging module import path."""
 
-from app.core.logger import (  # noqa: F401
-    get_logger,
-    init_logging,
-    log_context,
-    progress_manager,
-    set_level,
-    shutdown_logging,
-    timeit,
-)
-
-__all__ = [
-    "get_logger",
-    "init_logging",
-    "set_level",
-    "shutdown_logging",
-    "log_context",
-    "progress_manager",
-    "timeit",
-]
+from app.core.logger import *  # noqa: F401,F403
+from app.core.logger import __all__  # noqa: F401
@@ -1,14 +1,17 @@
 """FastAPI application instance and startup hooks."""
 from __future__ import annotations
 
+from pathlib import Path
+
 from fastapi import FastAPI, Request
 from fastapi.staticfiles import StaticFiles
 from fastapi.responses import RedirectResponse
-from fastapi.templating import Jinja2Templates
 
 from app.core import get_logger
+from app.core.config import get_settings
 from app.core.paths import with_root_path
-from app.core.security import get_security_provider
+from app.core.security import current_user, get_security_provider
+from app.core.templates import preload_templates, templates
 from app.middleware.auth import AuthMiddleware
 from app.middleware.forwarded_prefix import ForwardedPrefixMiddleware
 from app.routers import (
@@ -36,6 +39,11 @@ from app.chatbot_integration import (
 
 LOGGER = get_logger(__name__)
 
+# Shared by all workers on the host when ADMIN_SNAPSHOT is enabled; the first
+# one to warm up writes it.
+# Anchored to the project directory rather than the working directory.
+ADMIN_SNAPSHOT_DIR = Path(__file__).resolve().parent.parent / ".cache" / "admin"
+
 
 def create_app() -> FastAPI:
     """Create and configure the FastAPI application."""
@@ -55,7 +63,6 @@ def create_app() -> FastAPI:
     app.include_router(presentation_router)
 
     # Configure AI Chatbot
-    templates = Jinja2Templates(directory="app/templates")
     configure_chatbot_templates(templates)
     configure_chatbot_dependencies(
         get_db=get_db_session,
@@ -66,6 +73,12 @@ def create_app() -> FastAPI:
     LOGGER.info("AI Chatbot integrated successfully")
 
     session_factory = get_sessionmaker()
+    use_admin_snapshot = get_settings().admin_snapshot
+
+    @app.on_event("startup")
+    def compile_templates() -> None:
+        count = preload_templates()
+        LOGGER.info("Precompiled %d templates", count)
 
     @app.on_event("startup")
     def warm_admin_datasets() -> None:
@@ -73,6 +86,9 @@ def create_app() -> FastAPI:
         session = session_factory()
         admin_service = AdminService()
         try:
+            if use_admin_snapshot and AdminService.load_snapshot(session, ADMIN_SNAPSHOT_DIR):
+                LOGGER.info("Loaded admin dashboard datasets from snapshot")
+                return
             AdminService.refresh_metrics(session)
             admin_service.get_individual_overview(session)
             admin_service.get_company_overview(session)
@@ -82,12 +98,18 @@ def create_app() -> FastAPI:
         except Exception:  # pragma: no cover - fail fast on startup issues
             LOGGER.exception("Failed to precompute admin dashboard data")
             raise
+        else:
+            if use_admin_snapshot:
+                try:
+                    AdminService.write_snapshot(session, ADMIN_SNAPSHOT_DIR)
+                except OSError as exc:
+                    LOGGER.warning("Could not write admin dashboard snapshot: %s", exc)
         finally:
             session.close()
 
     @app.get("/", include_in_schema=False)
     async def root_redirect(request: Request):
-        user = getattr(request.state, "user", None)
+        user = current_user()
         destination = "/dashboard/"
         if user is not None:
             destination = default_destination(user)
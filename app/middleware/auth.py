@@ -1,54 +1,146 @@
 """Application middleware to enforce login requirements."""
 from __future__ import annotations
 
-from collections.abc import Awaitable, Callable
 from typing import Iterable
 
-from starlette.middleware.base import BaseHTTPMiddleware
-from starlette.requests import Request
-from starlette.responses import RedirectResponse, Response
+from starlette.requests import Request, cookie_parser
+from starlette.responses import RedirectResponse
+from starlette.types import ASGIApp, Receive, Scope, Send
 
 from app.core.logger import get_logger
 from app.core.paths import cookie_path, with_root_path
-from app.core.security import AuthenticationError, AuthenticatedUser, SecurityProvider
+from app.core.security import (
+    AuthenticationError,
+    AuthenticatedUser,
+    SecurityProvider,
+    authenticated_user_context,
+)
 
 LOGGER = get_logger(__name__)
 
+# Scope key holding the parsed ``Cookie`` header for the request.
+_COOKIES_SCOPE_KEY = "finance.cookies"
 
-class AuthMiddleware(BaseHTTPMiddleware):
-    """Redirect unauthenticated requests to the login page."""
+
+def _scope_cookies(scope: Scope) -> dict[str, str]:
+    """Return the request cookies, parsing the header at most once per scope.
+
+    ``Request.cookies`` is cached per ``Request`` object, but each middleware
+    and endpoint builds its own, so the header would otherwise be re-parsed.
+    """
+
+    cookies = scope.get(_COOKIES_SCOPE_KEY)
+    if cookies is None:
+        cookies = {}
+        for key, value in scope.get("headers", ()):
+            if key == b"cookie":
+                cookies = cookie_parser(value.decode("latin-1"))
+                break
+        scope[_COOKIES_SCOPE_KEY] = cookies
+    return cookies
+
+
+class AuthMiddleware:
+    """Redirect unauthenticated requests to the login page.
+
+    Implemented as plain ASGI middleware: ``BaseHTTPMiddleware`` would wrap
+    every request, including static files, in a task group and memory
+    streams just to expose ``call_next``.
+    """
+
+    _DOC_PATHS = frozenset({"/openapi.json", "/docs", "/redoc", "/favicon.ico"})
+    _MAX_REDIRECT_VARIANTS = 32
 
     def __init__(
         self,
-        app,
+        app: ASGIApp,
         security_provider: SecurityProvider,
         *,
         login_path: str = "/login",
         logout_path: str = "/logout",
         exempt_paths: Iterable[str] | None = None,
         exempt_prefixes: Iterable[str] | None = None,
+        check_cookie_on_prefixes: bool = False,
     ) -> None:
-        super().__init__(app)
+        self.app = app
         self._security_provider = security_provider
         self._login_path = login_path
         self._logout_path = logout_path
-        self._exempt_paths = set(exempt_paths or ()) | {login_path, logout_path}
+        self._exempt_paths = frozenset(
+            {login_path, logout_path, *self._DOC_PATHS, *(exempt_paths or ())}
+        )
         self._exempt_prefixes = tuple(exempt_prefixes or ("/static",))
+        # Stale cookies are normally cleared on any exempt path; prefixed
+        # asset requests skip that unless explicitly asked to.
+        self._check_cookie_on_prefixes = check_cookie_on_prefixes
+        self._redirect_headers: dict[tuple[str, bool], list[tuple[bytes, bytes]]] = {}
 
     def _is_exempt(self, path: str) -> bool:
         """Return ``True`` when the request path should bypass authentication."""
 
-        if path in self._exempt_paths:
-            return True
-        for prefix in self._exempt_prefixes:
-            if path.startswith(prefix):
-                return True
-        return path in {"/openapi.json", "/docs", "/redoc", "/favicon.ico"}
-
-    async def dispatch(
-        self, request: Request, call_next: Callable[[Request], Awaitable[Response]]
-    ) -> Response:
-        token = request.cookies.get(self._security_provider.cookie_name)
+        # One probe for exact paths; str.startswith accepts the whole prefix
+        # tuple in a single C-level call.
+        return path in self._exempt_paths or path.startswith(self._exempt_prefixes)
+
+    def _login_redirect_headers(
+        self, scope: Scope, clear_cookie: bool
+    ) -> list[tuple[bytes, bytes]]:
+        """Return the encoded headers of the login redirect for this root path.
+
+        The redirect only varies with ``root_path`` and whether the cookie is
+        cleared, so the encoded header list is built once per variant.
+        """
+
+        cache_key = (scope.get("root_path", ""), clear_cookie)
+        headers = self._redirect_headers.get(cache_key)
+        if headers is None:
+            request = Request(scope)
+            response = RedirectResponse(
+                with_root_path(request, self._login_path), status_code=303
+            )
+            if clear_cookie:
+                # Max-Age=0 takes precedence over the Expires date baked in
+                # here, so the cached header keeps deleting the cookie.
+                response.delete_cookie(
+                    self._security_provider.cookie_name,
+                    path=cookie_path(request),
+                )
+            headers = response.raw_headers
+            # root_path can come from a client-supplied header; stay bounded.
+            if len(self._redirect_headers) < self._MAX_REDIRECT_VARIANTS:
+                self._redirect_headers[cache_key] = headers
+        return headers
+
+    async def _redirect_to_login(self, scope: Scope, send: Send, *, clear_cookie: bool) -> None:
+        await send(
+            {
+                "type": "http.response.start",
+                "status": 303,
+                "headers": self._login_redirect_headers(scope, clear_cookie),
+            }
+        )
+        await send({"type": "http.response.body", "body": b""})
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        # Strip root_path prefix if present (when running behind a proxy).
+        raw_path = scope["path"]
+        root_path = scope.get("root_path", "")
+        if root_path and raw_path.startswith(root_path):
+            path = raw_path[len(root_path):] or "/"
+        else:
+            path = raw_path
+
+        if not self._check_cookie_on_prefixes and path.startswith(self._exempt_prefixes):
+            # Static assets never need the user: skip the cookie parse and
+            # token decode entirely.
+            await self.app(scope, receive, send)
+            return
+
+        token = _scope_cookies(scope).get(self._security_provider.cookie_name)
         user: AuthenticatedUser | None = None
         invalid_token = False
 
@@ -59,37 +151,17 @@ class AuthMiddleware(BaseHTTPMiddleware):
                 LOGGER.info("Failed to decode access token", extra={"reason": str(exc)})
                 invalid_token = True
 
-        request.state.user = user
-        # Strip root_path prefix if present (when running behind a proxy).
-        raw_path = request.scope.get("path", request.url.path)
-        root_path = request.scope.get("root_path", "")
-        if root_path and raw_path.startswith(root_path):
-            path = raw_path[len(root_path):] or "/"
-        else:
-            path = raw_path
-
         if self._is_exempt(path):
             if invalid_token:
-                login_url = with_root_path(request, self._login_path)
-                response = RedirectResponse(login_url, status_code=303)
-                response.delete_cookie(
-                    self._security_provider.cookie_name,
-                    path=cookie_path(request),
-                )
-                return response
-            return await call_next(request)
-
-        if user is None:
-            login_url = with_root_path(request, self._login_path)
-            response = RedirectResponse(login_url, status_code=303)
-            if token:
-                response.delete_cookie(
-                    self._security_provider.cookie_name,
-                    path=cookie_path(request),
-                )
-            return response
-
-        return await call_next(request)
+                await self._redirect_to_login(scope, send, clear_cookie=True)
+                return
+        elif user is None:
+            await self._redirect_to_login(scope, send, clear_cookie=bool(token))
+            return
+
+        # Dependencies read the user through security.current_user().
+        with authenticated_user_context(user):
+            await self.app(scope, receive, send)
 
 
 __all__ = ["AuthMiddleware"]
@@ -18,11 +18,18 @@ class ForwardedPrefixMiddleware:
 
     async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
         if scope["type"] in ("http", "websocket"):
-            headers = dict(scope.get("headers", []))
-            prefix = headers.get(b"x-forwarded-prefix", b"").decode("latin-1")
-            if prefix:
-                scope = dict(scope)
-                scope["root_path"] = prefix
+            # Scan for the one header instead of building a dict of all of them.
+            raw_prefix = b""
+            for key, value in scope.get("headers", ()):
+                if key == b"x-forwarded-prefix":
+                    raw_prefix = value
+                    break
+            # Requests without the header never pay for a decode.
+            if raw_prefix:
+                prefix = raw_prefix.decode("latin-1")
+                # Skip the copy when an upstream layer already applied the prefix.
+                if prefix != scope.get("root_path", ""):
+                    scope = {**scope, "root_path": prefix}
         await self.app(scope, receive, send)
 
 
@@ -9,6 +9,7 @@ from sqlalchemy import (
     Date,
     DateTime,
     ForeignKey,
+    Index,
     Integer,
     String,
 )
@@ -23,9 +24,17 @@ class EmploymentContract(Base):
     """Employment relationship between an individual party and a company party."""
 
     __tablename__ = "employment_contract"
+    __table_args__ = (
+        Index(
+            "ix_employment_employee_current",
+            "employee_party_id",
+            "is_primary",
+            "start_date",
+        ),
+    )
 
     id: Mapped[int] = mapped_column(_ID_TYPE, primary_key=True, autoincrement=True)
-    employee_party_id: Mapped[int] = mapped_column(ForeignKey("party.id"), nullable=False, index=True)
+    employee_party_id: Mapped[int] = mapped_column(ForeignKey("party.id"), nullable=False)
     employer_party_id: Mapped[int] = mapped_column(ForeignKey("party.id"), nullable=False, index=True)
     position_title: Mapped[str] = mapped_column(String(160), nullable=False)
     start_date: Mapped[date] = mapped_column(Date, nullable=False)
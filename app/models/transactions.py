@@ -11,6 +11,7 @@ from sqlalchemy import (
     Date,
     DateTime,
     ForeignKey,
+    Index,
     Integer,
     Numeric,
     SmallInteger,
@@ -79,7 +80,10 @@ class Account(Base):
 
     __tablename__ = "account"
 
-    __table_args__ = (UniqueConstraint("iban", name="uniq_iban"),)
+    __table_args__ = (
+        UniqueConstraint("iban", name="uniq_iban"),
+        Index("ix_account_party_type", "party_id", "account_type_code"),
+    )
 
     id: Mapped[int] = mapped_column(_ID_TYPE, primary_key=True, autoincrement=True)
     party_id: Mapped[int] = mapped_column(_ID_TYPE, ForeignKey("party.id"), nullable=False)
@@ -127,6 +131,7 @@ class JournalEntry(Base):
     """Double-entry journal header."""
 
     __tablename__ = "journal_entry"
+    __table_args__ = (Index("ix_journal_entry_date", "txn_date"),)
 
     id: Mapped[int] = mapped_column(_ID_TYPE, primary_key=True, autoincrement=True)
     entry_code: Mapped[str] = mapped_column(String(64), unique=True, nullable=False)
@@ -154,6 +159,7 @@ class JournalLine(Base):
     """Double-entry journal line item."""
 
     __tablename__ = "journal_line"
+    __table_args__ = (Index("ix_journal_line_account_entry", "account_id", "entry_id"),)
 
     id: Mapped[int] = mapped_column(_ID_TYPE, primary_key=True, autoincrement=True)
     entry_id: Mapped[int] = mapped_column(_ID_TYPE, ForeignKey("journal_entry.id"), nullable=False)
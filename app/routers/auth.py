@@ -9,6 +9,7 @@ from app.core.paths import cookie_path, with_root_path
 from app.core.security import (
     AuthenticatedUser,
     SecurityProvider,
+    current_user,
     get_security_provider,
 )
 from app.core.templates import templates
@@ -60,7 +61,7 @@ def _get_user_counts() -> dict[str, int]:
 async def login_form(request: Request) -> HTMLResponse:
     """Render the login form. Redirect when already authenticated."""
 
-    user: AuthenticatedUser | None = getattr(request.state, "user", None)
+    user: AuthenticatedUser | None = current_user()
     if user is not None:
         LOGGER.debug("User already authenticated", extra={"username": user.username})
         redirect_to = with_root_path(request, default_destination(user))
@@ -1,9 +1,14 @@
 """Service implementation for admin tooling."""
 from __future__ import annotations
 
+import hashlib
+import json
+import os
 from collections import Counter, defaultdict
-from datetime import date
+from datetime import date, datetime
 from decimal import Decimal
+from pathlib import Path
+from sys import intern
 from threading import Lock
 from typing import Sequence
 
@@ -17,6 +22,7 @@ from app.models import (
     CashFlowFact,
     Category,
     EmploymentContract,
+    Holding,
     Instrument,
     JournalEntry,
     JournalLine,
@@ -30,6 +36,7 @@ from app.models import (
     UserPartyMap,
 )
 from app.models.party import CompanyProfile, IndividualProfile, Party, PartyType
+from app.services.dashboard_helpers import _ZERO, engine_cache_key, to_decimal
 from app.services.stocks_service import brokerage_aum_by_party
 from app.schemas.admin import (
     AdminMetrics,
@@ -43,6 +50,8 @@ from app.schemas.admin import (
 
 LOGGER = get_logger(__name__)
 
+_MONTHS_PER_YEAR = Decimal(12)
+
 
 _METRICS_SNAPSHOTS: dict[str, AdminMetrics] = {}
 _INDIVIDUAL_OVERVIEWS: dict[str, ListView] = {}
@@ -55,6 +64,70 @@ _TRANSACTION_OVERVIEWS: dict[str, ListView] = {}
 _TRANSACTION_DISTRIBUTIONS: dict[str, dict[str, int]] = {}
 _metrics_lock = Lock()
 
+# Per-engine caches persisted by ``write_snapshot`` so that other worker
+# processes can start from the same precomputed datasets.
+_SNAPSHOT_CACHES: dict[str, dict[str, object]] = {
+    "metrics": _METRICS_SNAPSHOTS,  # type: ignore[dict-item]
+    "individual_overviews": _INDIVIDUAL_OVERVIEWS,  # type: ignore[dict-item]
+    "individual_distributions": _INDIVIDUAL_DISTRIBUTIONS,  # type: ignore[dict-item]
+    "company_overviews": _COMPANY_OVERVIEWS,  # type: ignore[dict-item]
+    "company_distributions": _COMPANY_DISTRIBUTIONS,  # type: ignore[dict-item]
+    "stock_overviews": _STOCK_OVERVIEWS,  # type: ignore[dict-item]
+    "stock_series": _STOCK_SERIES_CACHE,  # type: ignore[dict-item]
+    "transaction_overviews": _TRANSACTION_OVERVIEWS,  # type: ignore[dict-item]
+    "transaction_distributions": _TRANSACTION_DISTRIBUTIONS,  # type: ignore[dict-item]
+}
+_SNAPSHOT_PREFIX = "admin_warm_"
+_SNAPSHOT_SUFFIX = ".json"
+
+# Cache entries that are pydantic models; the rest are plain JSON structures.
+_SNAPSHOT_MODELS: dict[str, type[AdminMetrics] | type[ListView]] = {
+    "metrics": AdminMetrics,
+    "individual_overviews": ListView,
+    "company_overviews": ListView,
+    "stock_overviews": ListView,
+    "transaction_overviews": ListView,
+}
+
+
+def _snapshot_default(value: object) -> dict[str, str]:
+    """Tag values JSON has no type for so they load back unchanged."""
+
+    if isinstance(value, Decimal):
+        return {"__decimal__": str(value)}
+    if isinstance(value, datetime):
+        return {"__datetime__": value.isoformat()}
+    if isinstance(value, date):
+        return {"__date__": value.isoformat()}
+    raise TypeError(f"Cannot snapshot {type(value).__name__}")
+
+
+def _snapshot_object_hook(obj: dict[str, object]) -> object:
+    if len(obj) == 1:
+        if "__decimal__" in obj:
+            return Decimal(obj["__decimal__"])  # type: ignore[arg-type]
+        if "__datetime__" in obj:
+            return datetime.fromisoformat(obj["__datetime__"])  # type: ignore[arg-type]
+        if "__date__" in obj:
+            return date.fromisoformat(obj["__date__"])  # type: ignore[arg-type]
+    return obj
+
+
+def _dump_snapshot_entry(name: str, value: object) -> object:
+    if name in _SNAPSHOT_MODELS:
+        return value.model_dump()  # type: ignore[attr-defined]
+    return value
+
+
+def _load_snapshot_entry(name: str, value: object) -> object:
+    model = _SNAPSHOT_MODELS.get(name)
+    if model is not None:
+        return model.model_validate(value)
+    if name == "stock_series":
+        points, label, hint = value  # type: ignore[misc]
+        return ([tuple(point) for point in points], label, hint)
+    return value
+
 
 class AdminService:
     """Service encapsulating administrator dashboard workflows."""
@@ -121,16 +194,7 @@ class AdminService:
 
         return self._bucketize(amount, self.TRANSACTION_SIZE_BUCKETS)
 
-    @staticmethod
-    def _engine_key(session: Session) -> str:
-        bind = session.get_bind()
-        if bind is None:
-            return "unbound"
-        try:
-            url = bind.url
-            return url.render_as_string(hide_password=True)
-        except AttributeError:  # pragma: no cover - fallback for unusual engines
-            return str(id(bind))
+    _engine_key = staticmethod(engine_cache_key)
 
     @classmethod
     def refresh_metrics(cls, session: Session) -> AdminMetrics:
@@ -218,8 +282,8 @@ class AdminService:
 
             row = session.execute(metrics_stmt).one()
 
-            total_cash = Decimal(row.total_cash or 0)
-            total_holdings = Decimal(row.total_holdings or 0)
+            total_cash = to_decimal(row.total_cash)
+            total_holdings = to_decimal(row.total_holdings)
             total_aum = total_cash + total_holdings
 
             metrics = AdminMetrics(
@@ -260,6 +324,94 @@ class AdminService:
             _STOCK_OVERVIEWS.clear()
             _TRANSACTION_OVERVIEWS.clear()
 
+    @classmethod
+    def dataset_fingerprint(cls, session: Session) -> str:
+        """Return a cheap freshness token for the admin datasets.
+
+        Combines the engine, today's date (several datasets filter on it and
+        prices are loaded daily) and, in one query, the primary-key high-water
+        marks of the tables the datasets read plus the latest holding update.
+        Each marker is an index lookup. Inserts invalidate the token; in-place
+        edits and deletes do not, which is why snapshots are opt-in.
+        """
+
+        markers = session.execute(
+            select(
+                select(func.max(JournalLine.id)).scalar_subquery(),
+                select(func.max(JournalEntry.id)).scalar_subquery(),
+                select(func.max(Party.id)).scalar_subquery(),
+                select(func.max(Account.id)).scalar_subquery(),
+                select(func.max(EmploymentContract.id)).scalar_subquery(),
+                select(func.max(ReportingPeriod.id)).scalar_subquery(),
+                select(func.max(Instrument.id)).scalar_subquery(),
+                select(func.max(Holding.updated_at)).scalar_subquery(),
+            )
+        ).one()
+        raw = "|".join(
+            [cls._engine_key(session), date.today().isoformat(), *map(str, markers)]
+        )
+        return hashlib.sha256(raw.encode("utf-8")).hexdigest()[:16]
+
+    @classmethod
+    def write_snapshot(cls, session: Session, directory: Path) -> Path:
+        """Persist the cached datasets for the session's engine to ``directory``.
+
+        The file is JSON, written atomically into a directory only the app
+        user can access, and older snapshots are removed.
+        """
+
+        key = cls._engine_key(session)
+        with _metrics_lock:
+            payload = {
+                name: _dump_snapshot_entry(name, cache[key])
+                for name, cache in _SNAPSHOT_CACHES.items()
+                if key in cache
+            }
+        directory.mkdir(mode=0o700, parents=True, exist_ok=True)
+        target = directory / f"{_SNAPSHOT_PREFIX}{cls.dataset_fingerprint(session)}{_SNAPSHOT_SUFFIX}"
+        # Outside the snapshot glob below, so concurrent writers never delete
+        # each other's in-flight file.
+        tmp = directory / f"tmp-{os.getpid()}-{target.name}"
+        with tmp.open("w", encoding="utf-8") as handle:
+            json.dump(payload, handle, default=_snapshot_default, ensure_ascii=False)
+        os.replace(tmp, target)
+        for stale in directory.glob(f"{_SNAPSHOT_PREFIX}*"):
+            if stale != target:
+                stale.unlink(missing_ok=True)
+        return target
+
+    @classmethod
+    def load_snapshot(cls, session: Session, directory: Path) -> bool:
+        """Populate the caches from a snapshot matching the current data.
+
+        Returns ``False`` when no valid snapshot exists for the current
+        fingerprint. Snapshots are plain JSON validated against the admin
+        schemas, so loading one cannot execute code; whoever can write to
+        ``directory`` can still change what the admin dashboard displays, so
+        it must be owned by the application user.
+        """
+
+        target = directory / f"{_SNAPSHOT_PREFIX}{cls.dataset_fingerprint(session)}{_SNAPSHOT_SUFFIX}"
+        try:
+            with target.open(encoding="utf-8") as handle:
+                raw = json.load(handle, object_hook=_snapshot_object_hook)
+            payload = {
+                name: _load_snapshot_entry(name, value)
+                for name, value in raw.items()
+                if name in _SNAPSHOT_CACHES
+            }
+        except FileNotFoundError:
+            return False
+        except (OSError, ValueError, TypeError, AttributeError) as exc:
+            LOGGER.warning("Ignoring unreadable admin snapshot %s: %s", target, exc)
+            return False
+
+        key = cls._engine_key(session)
+        with _metrics_lock:
+            for name, value in payload.items():
+                _SNAPSHOT_CACHES[name][key] = value
+        return True
+
     def get_individual_overview(self, session: Session) -> ListView:
         """Return a reusable list view model for individual users."""
 
@@ -456,12 +608,12 @@ class AdminService:
             income_counts: Counter[str] = Counter()
 
             for record in records:
-                monthly_income = Decimal(record.monthly_income or 0)
-                checking_balance = Decimal(record.checking_balance or 0)
-                savings_balance = Decimal(record.savings_balance or 0)
-                brokerage_aum = Decimal(record.brokerage_aum or 0)
+                monthly_income = to_decimal(record.monthly_income)
+                checking_balance = to_decimal(record.checking_balance)
+                savings_balance = to_decimal(record.savings_balance)
+                brokerage_aum = to_decimal(record.brokerage_aum)
 
-                annual_income = monthly_income * Decimal(12)
+                annual_income = monthly_income * _MONTHS_PER_YEAR
                 income_bucket = self._categorize_income(annual_income)
                 income_counts[income_bucket] += 1
 
@@ -478,8 +630,10 @@ class AdminService:
                         key=str(identifier),
                         values={
                             "name": record.display_name,
-                            "job_title": record.position_title or "",
-                            "employer": record.employer_name,
+                            # Few distinct titles/employers across many users;
+                            # interned so cached rows share them.
+                            "job_title": intern(record.position_title or ""),
+                            "employer": record.employer_name and intern(record.employer_name),
                             "monthly_income": monthly_income,
                             "checking_aum": checking_balance,
                             "savings_aum": savings_balance,
@@ -585,8 +739,8 @@ class AdminService:
                 record.party_id for record in company_records if record.party_id is not None
             }
 
-            monthly_income_map: defaultdict[int, Decimal] = defaultdict(lambda: Decimal("0"))
-            monthly_expense_map: defaultdict[int, Decimal] = defaultdict(lambda: Decimal("0"))
+            monthly_income_map: defaultdict[int, Decimal] = defaultdict(lambda: _ZERO)
+            monthly_expense_map: defaultdict[int, Decimal] = defaultdict(lambda: _ZERO)
             profit_total_map: dict[int, Decimal] = {}
 
             if company_party_ids:
@@ -627,9 +781,9 @@ class AdminService:
                 for row in cash_rows:
                     section_name = row.section_name
                     if section_name == "income":
-                        monthly_income_map[row.party_id] = Decimal(row.inflow_amount or 0)
+                        monthly_income_map[row.party_id] = to_decimal(row.inflow_amount)
                     elif section_name == "expense":
-                        monthly_expense_map[row.party_id] = Decimal(row.outflow_amount or 0)
+                        monthly_expense_map[row.party_id] = to_decimal(row.outflow_amount)
 
                 profit_rows = session.execute(
                     select(
@@ -644,10 +798,10 @@ class AdminService:
                     .group_by(CashFlowFact.party_id)
                 ).all()
                 profit_total_map = {
-                    row.party_id: Decimal(row.profit_total or 0) for row in profit_rows
+                    row.party_id: to_decimal(row.profit_total) for row in profit_rows
                 }
 
-            monthly_salary_map: defaultdict[int, Decimal] = defaultdict(lambda: Decimal("0"))
+            monthly_salary_map: defaultdict[int, Decimal] = defaultdict(lambda: _ZERO)
             payroll_employee_map: dict[int, int] = {}
             if company_party_ids:
                 latest_payroll = (
@@ -687,7 +841,7 @@ class AdminService:
 
                 for row in payroll_rows:
                     employer_party_id = row.employer_party_id
-                    monthly_salary_map[employer_party_id] = Decimal(row.monthly_salary_cost or 0)
+                    monthly_salary_map[employer_party_id] = to_decimal(row.monthly_salary_cost)
                     payroll_employee_map[employer_party_id] = int(row.employee_count or 0)
 
             contract_employee_map: dict[int, int] = {}
@@ -720,17 +874,17 @@ class AdminService:
                 company_name = record.display_name or "Unknown company"
                 party_id = record.party_id
 
-                monthly_income = Decimal("0")
-                monthly_expenses = Decimal("0")
-                profit_total = Decimal("0")
-                monthly_salary_cost = Decimal("0")
+                monthly_income = _ZERO
+                monthly_expenses = _ZERO
+                profit_total = _ZERO
+                monthly_salary_cost = _ZERO
                 employee_count = 0
 
                 if party_id is not None:
-                    monthly_income = monthly_income_map.get(party_id, Decimal("0"))
-                    monthly_expenses = monthly_expense_map.get(party_id, Decimal("0"))
-                    profit_total = profit_total_map.get(party_id, Decimal("0"))
-                    monthly_salary_cost = monthly_salary_map.get(party_id, Decimal("0"))
+                    monthly_income = monthly_income_map.get(party_id, _ZERO)
+                    monthly_expenses = monthly_expense_map.get(party_id, _ZERO)
+                    profit_total = profit_total_map.get(party_id, _ZERO)
+                    monthly_salary_cost = monthly_salary_map.get(party_id, _ZERO)
 
                     payroll_count = payroll_employee_map.get(party_id)
                     contract_count = contract_employee_map.get(party_id, 0)
@@ -960,12 +1114,12 @@ class AdminService:
                 total_qty = (
                     Decimal(record.total_qty)
                     if record.total_qty is not None
-                    else Decimal(0)
+                    else _ZERO
                 )
                 market_value = (
                     Decimal(record.market_value)
                     if record.market_value is not None
-                    else Decimal(0)
+                    else _ZERO
                 )
 
                 product_label = (
@@ -1284,6 +1438,7 @@ class AdminService:
 
             rows: list[ListViewRow] = []
             transaction_amount_counts: Counter[str] = Counter()
+            date_labels: dict[date, str] = {}
 
             for record in records:
                 payer_name = record.payer_name or record.counterparty_name or "Account transfer"
@@ -1291,12 +1446,17 @@ class AdminService:
 
                 amount_value = Decimal(record.payee_amount or record.payer_amount or 0)
                 currency_code = record.payee_currency or record.payer_currency
-                category_name = record.category_name or record.section_name or "Uncategorised"
-
-                amount_bucket = self._categorize_transaction_amount(abs(amount_value))
+                category_name = intern(record.category_name or record.section_name or "Uncategorised")
+                date_label = date_labels.get(record.txn_date)
+                if date_label is None:
+                    date_label = date_labels[record.txn_date] = record.txn_date.strftime("%Y-%m-%d")
+
+                # Both candidate amounts are abs() in SQL, so this rarely negates.
+                size = -amount_value if amount_value.is_signed() else amount_value
+                amount_bucket = self._categorize_transaction_amount(size)
                 transaction_amount_counts[amount_bucket] += 1
 
-                search_terms = [str(record.txn_date), payer_name, payee_name]
+                search_terms = [date_label, payer_name, payee_name]
                 if category_name:
                     search_terms.append(category_name)
                 if record.description:
@@ -1306,7 +1466,7 @@ class AdminService:
                     ListViewRow(
                         key=str(record.entry_id),
                         values={
-                            "date": record.txn_date.strftime("%Y-%m-%d"),
+                            "date": date_label,
                             "payer": payer_name,
                             "payee": payee_name,
                             "amount": amount_value,
@@ -35,10 +35,21 @@ from app.schemas.companies import (
     SummaryMetrics,
     TransactionSummary,
 )
-from app.services.dashboard_helpers import fetch_category_breakdown
+from app.services.dashboard_helpers import (
+    _ZERO,
+    engine_cache_key,
+    fetch_category_breakdown,
+    to_decimal,
+)
 
 LOGGER = get_logger(__name__)
 
+# Party id and display name per company id, keyed by engine URL. Companies are
+# not renamed through the app; call ``CompaniesService.clear_identity_cache``
+# after editing them directly in the database.
+_COMPANY_IDENTITIES: dict[str, dict[int, tuple[int, str]]] = {}
+_COMPANY_IDENTITY_LIMIT = 4096
+
 
 class CompaniesService:
     """Service that aggregates corporate level metrics."""
@@ -50,22 +61,7 @@ class CompaniesService:
 
         LOGGER.debug("Loading dashboard for company id=%s", company_id)
 
-        company_party_id = session.execute(
-            select(OrgPartyMap.party_id).where(OrgPartyMap.org_id == company_id)
-        ).scalar_one_or_none()
-
-        if company_party_id is None:
-            company_party_id = company_id
-
-        party = session.get(Party, company_party_id)
-        company_profile_row = session.get(CompanyProfileModel, company_party_id)
-
-        if not party or not company_profile_row:
-            msg = f"Company {company_id} not found"
-            LOGGER.warning(msg)
-            raise ValueError(msg)
-
-        company_name = party.display_name or company_profile_row.legal_name or f"Company {company_id}"
+        company_party_id, company_name = self._company_identity(session, company_id)
 
         latest_cash_period = None
         if company_party_id:
@@ -101,8 +97,8 @@ class CompaniesService:
 
 
         accounts: list[AccountSummary] = []
-        total_account_balance = Decimal("0")
-        cash_balance = Decimal("0")
+        total_account_balance = _ZERO
+        cash_balance = _ZERO
 
         if company_party_id:
             balance_case = func.coalesce(func.sum(JournalLine.amount), 0).label("balance")
@@ -126,26 +122,25 @@ class CompaniesService:
                 AccountSummary(
                     id=row.id,
                     name=row.name,
-                    type=str(row.account_type),
+                    type=row.account_type,
                     currency=row.currency,
-                    balance=Decimal(row.balance or 0),
+                    balance=to_decimal(row.balance),
                 )
                 for row in account_rows
             ]
 
-            total_account_balance = sum((account.balance for account in accounts), Decimal("0"))
-            cash_balance = sum(
-                (
-                    account.balance
-                    for account in accounts
-                    if account.type != AccountType.BROKERAGE.value
-                ),
-                Decimal("0"),
-            )
+            total_account_balance = _ZERO
+            cash_balance = _ZERO
+            for account in accounts:
+                total_account_balance += account.balance
+                if account.type != AccountType.BROKERAGE.value:
+                    cash_balance += account.balance
 
-        holdings_total = Decimal("0")
+        holdings_total = _ZERO
         if company_party_id:
-            holdings_period_id = session.execute(
+            # The latest holdings period is resolved inside the aggregate, so
+            # the total costs one round trip; no period simply sums to zero.
+            holdings_period_id = (
                 select(ReportingPeriod.id)
                 .join(
                     HoldingPerformanceFact,
@@ -154,17 +149,16 @@ class CompaniesService:
                 .where(HoldingPerformanceFact.party_id == company_party_id)
                 .order_by(ReportingPeriod.period_end.desc())
                 .limit(1)
+                .scalar_subquery()
+            )
+            holdings_value = session.execute(
+                select(func.coalesce(func.sum(HoldingPerformanceFact.market_value), 0))
+                .where(
+                    HoldingPerformanceFact.reporting_period_id == holdings_period_id,
+                    HoldingPerformanceFact.party_id == company_party_id,
+                )
             ).scalar_one_or_none()
-
-            if holdings_period_id:
-                holdings_value = session.execute(
-                    select(func.coalesce(func.sum(HoldingPerformanceFact.market_value), 0))
-                    .where(
-                        HoldingPerformanceFact.reporting_period_id == holdings_period_id,
-                        HoldingPerformanceFact.party_id == company_party_id,
-                    )
-                ).scalar_one_or_none()
-                holdings_total = Decimal(holdings_value or 0)
+            holdings_total = to_decimal(holdings_value)
 
         income_breakdown: list[CategoryBreakdown] = []
         expense_breakdown: list[CategoryBreakdown] = []
@@ -212,10 +206,8 @@ class CompaniesService:
                 )
             ]
 
-        period_income = sum((category.total for category in income_breakdown), Decimal("0"))
-        period_expenses = sum((category.total for category in expense_breakdown), Decimal("0"))
-        net_cash_flow = period_income - period_expenses
-
+        # Reporting-period facts take precedence; the breakdown totals are only
+        # summed when there are none.
         if latest_cash_period and company_party_id:
             flow_rows = session.execute(
                 select(
@@ -231,14 +223,14 @@ class CompaniesService:
                 )
             ).all()
 
-            income_from_fact = Decimal("0")
-            expense_from_fact = Decimal("0")
-            net_from_fact = Decimal("0")
+            income_from_fact = _ZERO
+            expense_from_fact = _ZERO
+            net_from_fact = _ZERO
 
             for row in flow_rows:
-                inflow = Decimal(row.inflow_amount or 0)
-                outflow = Decimal(row.outflow_amount or 0)
-                net = Decimal(row.net_amount or 0)
+                inflow = to_decimal(row.inflow_amount)
+                outflow = to_decimal(row.outflow_amount)
+                net = to_decimal(row.net_amount)
                 if row.name == "income":
                     income_from_fact += inflow
                 elif row.name == "expense":
@@ -248,8 +240,12 @@ class CompaniesService:
             period_income = income_from_fact
             period_expenses = expense_from_fact
             net_cash_flow = net_from_fact
+        else:
+            period_income = sum((category.total for category in income_breakdown), _ZERO)
+            period_expenses = sum((category.total for category in expense_breakdown), _ZERO)
+            net_cash_flow = period_income - period_expenses
 
-        total_profit = Decimal("0")
+        total_profit = _ZERO
         if company_party_id:
             total_profit_value = session.execute(
                 select(func.coalesce(func.sum(CashFlowFact.net_amount), 0))
@@ -262,7 +258,7 @@ class CompaniesService:
             total_profit = Decimal(total_profit_value or 0)
 
         employee_count = 0
-        monthly_salary_cost = Decimal("0")
+        monthly_salary_cost = _ZERO
         payroll_period_id = None
         if company_party_id:
             payroll_period_id = session.execute(
@@ -275,27 +271,25 @@ class CompaniesService:
             ).scalar_one_or_none()
 
             if payroll_period_id:
-                employee_result = session.execute(
-                    select(func.count(func.distinct(EmploymentContract.employee_party_id)))
-                    .select_from(PayrollFact)
-                    .join(EmploymentContract, EmploymentContract.id == PayrollFact.contract_id)
-                    .where(
-                        PayrollFact.reporting_period_id == payroll_period_id,
-                        EmploymentContract.employer_party_id == company_party_id,
+                # Headcount and salary cost share one scan of the period's payroll.
+                payroll_totals = session.execute(
+                    select(
+                        func.count(func.distinct(EmploymentContract.employee_party_id)).label(
+                            "employee_count"
+                        ),
+                        func.coalesce(func.sum(PayrollFact.gross_amount), 0).label(
+                            "salary_total"
+                        ),
                     )
-                ).scalar_one_or_none()
-                employee_count = int(employee_result or 0)
-
-                salary_total = session.execute(
-                    select(func.coalesce(func.sum(PayrollFact.gross_amount), 0))
                     .select_from(PayrollFact)
                     .join(EmploymentContract, EmploymentContract.id == PayrollFact.contract_id)
                     .where(
                         PayrollFact.reporting_period_id == payroll_period_id,
                         EmploymentContract.employer_party_id == company_party_id,
                     )
-                ).scalar_one_or_none()
-                monthly_salary_cost = Decimal(salary_total or 0)
+                ).one()
+                employee_count = int(payroll_totals.employee_count or 0)
+                monthly_salary_cost = to_decimal(payroll_totals.salary_total)
 
         payroll: list[PayrollEntry] = []
         if payroll_period_id:
@@ -320,7 +314,7 @@ class CompaniesService:
                 PayrollEntry(
                     user_id=row.user_id,
                     name=row.display_name,
-                    salary_amount=Decimal(row.gross_amount or 0),
+                    salary_amount=to_decimal(row.gross_amount),
                 )
                 for row in payroll_rows
             ]
@@ -361,6 +355,46 @@ class CompaniesService:
         LOGGER.debug("Dashboard assembled for company id=%s", company_id)
         return dashboard
 
+    @staticmethod
+    def clear_identity_cache() -> None:
+        """Forget the cached company party ids and display names."""
+
+        _COMPANY_IDENTITIES.clear()
+
+    @staticmethod
+    def _company_identity(session: Session, company_id: int) -> tuple[int, str]:
+        """Return the party id and display name for ``company_id``.
+
+        Resolved once per engine; later dashboards skip the org mapping and
+        both profile lookups.
+        """
+
+        cache = _COMPANY_IDENTITIES.setdefault(engine_cache_key(session), {})
+        identity = cache.get(company_id)
+        if identity is not None:
+            return identity
+
+        company_party_id = session.execute(
+            select(OrgPartyMap.party_id).where(OrgPartyMap.org_id == company_id)
+        ).scalar_one_or_none()
+
+        if company_party_id is None:
+            company_party_id = company_id
+
+        party = session.get(Party, company_party_id)
+        company_profile_row = session.get(CompanyProfileModel, company_party_id)
+
+        if not party or not company_profile_row:
+            msg = f"Company {company_id} not found"
+            LOGGER.warning(msg)
+            raise ValueError(msg)
+
+        company_name = party.display_name or company_profile_row.legal_name or f"Company {company_id}"
+        identity = (company_party_id, company_name)
+        if len(cache) < _COMPANY_IDENTITY_LIMIT:
+            cache[company_id] = identity
+        return identity
+
     def _collect_income_trend(
         self,
         session: Session,
@@ -384,9 +418,9 @@ class CompaniesService:
             .order_by(ReportingPeriod.period_start)
         ).all()
 
-        income_map = {row.period_label: Decimal(row.inflow_amount or 0) for row in rows}
+        income_map = {row.period_label: to_decimal(row.inflow_amount) for row in rows}
         return [
-            SeriesPoint(label=label, value=income_map.get(label, Decimal("0")))
+            SeriesPoint(label=label, value=income_map.get(label, _ZERO))
             for label in period_labels
         ]
 
@@ -399,7 +433,7 @@ class CompaniesService:
         """Return profit (income minus expenses) per reporting period."""
 
         flow_totals: dict[str, dict[str, Decimal]] = defaultdict(
-            lambda: {"income": Decimal("0"), "expense": Decimal("0")}
+            lambda: {"income": _ZERO, "expense": _ZERO}
         )
         rows = session.execute(
             select(
@@ -420,13 +454,13 @@ class CompaniesService:
 
         for row in rows:
             if row.section_name == "income":
-                flow_totals[row.period_label]["income"] = Decimal(row.inflow_amount or 0)
+                flow_totals[row.period_label]["income"] = to_decimal(row.inflow_amount)
             elif row.section_name == "expense":
-                flow_totals[row.period_label]["expense"] = Decimal(row.outflow_amount or 0)
+                flow_totals[row.period_label]["expense"] = to_decimal(row.outflow_amount)
 
         profit_trend = []
         for label in period_labels:
-            flows = flow_totals.get(label, {"income": Decimal("0"), "expense": Decimal("0")})
+            flows = flow_totals.get(label, {"income": _ZERO, "expense": _ZERO})
             profit_trend.append(SeriesPoint(label=label, value=flows["income"] - flows["expense"]))
         return profit_trend
 
@@ -439,7 +473,7 @@ class CompaniesService:
 
         if not party_id:
             fallback_label = "No reporting periods"
-            empty_point = SeriesPoint(label=fallback_label, value=Decimal("0"))
+            empty_point = SeriesPoint(label=fallback_label, value=_ZERO)
             return [fallback_label], [empty_point], [empty_point], []
 
         # Only use reporting periods that contain expense activity for this company to keep charts meaningful.
@@ -464,7 +498,7 @@ class CompaniesService:
         if not period_labels:
             fallback_label = "No reporting periods"
             period_labels = [fallback_label]
-            empty_point = SeriesPoint(label=fallback_label, value=Decimal("0"))
+            empty_point = SeriesPoint(label=fallback_label, value=_ZERO)
             return [fallback_label], [empty_point], [empty_point], []
 
         income_trend = self._collect_income_trend(session, party_id, period_labels)
@@ -13,6 +13,39 @@ from app.models import Account, AccountType, Category, JournalEntry, JournalLine
 
 BreakdownResult = tuple[str, Decimal, list[tuple[date, str | None, Decimal]]]
 
+_ZERO = Decimal("0")
+
+
+def engine_cache_key(session: Session) -> str:
+    """Return a string identifying the engine behind ``session``.
+
+    Used to key process-wide caches per database without holding a reference
+    to the engine itself.
+    """
+
+    bind = session.get_bind()
+    if bind is None:
+        return "unbound"
+    try:
+        url = bind.url
+        return url.render_as_string(hide_password=True)
+    except AttributeError:  # pragma: no cover - fallback for unusual engines
+        return str(id(bind))
+
+
+def to_decimal(value: Any) -> Decimal:
+    """Coerce a numeric column value to ``Decimal``, treating ``None`` as zero.
+
+    Numeric columns already come back as ``Decimal``; those are returned as-is
+    instead of being copied through the constructor.
+    """
+
+    if value.__class__ is Decimal:
+        return value
+    if value is None:
+        return _ZERO
+    return Decimal(value)
+
 
 def fetch_category_breakdown(
     session: Session,
@@ -76,19 +109,18 @@ def fetch_category_breakdown(
         )
         txn_rows = session.execute(transactions_query).all()
 
-        transactions = [
-            (
-                row.txn_date,
-                row.description,
-                Decimal(abs(row.amount or 0)),
-            )
-            for row in txn_rows
-        ]
+        transactions = []
+        for row in txn_rows:
+            amount = to_decimal(row.amount)
+            # Negate only when needed; abs() always allocates a new Decimal.
+            if amount.is_signed():
+                amount = -amount
+            transactions.append((row.txn_date, row.description, amount))
 
         results.append(
             (
                 total.category_name,
-                Decimal(total.total or 0),
+                to_decimal(total.total),
                 transactions,
             )
         )
@@ -119,7 +151,7 @@ def calculate_entity_net_worth(
         .join(JournalLine, JournalLine.account_id == Account.id, isouter=True)
         .where(Account.account_type_code != AccountType.BROKERAGE.value, *owner_filters)
     )
-    cash_balance = session.execute(cash_balance_query).scalar_one() or Decimal("0")
+    cash_balance = session.execute(cash_balance_query).scalar_one() or _ZERO
 
     # Calculate brokerage holdings value from PositionAgg view
     holdings_query = (
@@ -128,6 +160,6 @@ def calculate_entity_net_worth(
         .join(Account, Account.id == PositionAgg.account_id)
         .where(*owner_filters)
     )
-    holdings_value = session.execute(holdings_query).scalar_one() or Decimal("0")
+    holdings_value = session.execute(holdings_query).scalar_one() or _ZERO
 
     return cash_balance + holdings_value
@@ -3,6 +3,7 @@ from __future__ import annotations
 
 import calendar
 import math
+from bisect import bisect_left, bisect_right
 from collections import defaultdict
 from datetime import date, timedelta
 from decimal import Decimal
@@ -38,7 +39,7 @@ from app.schemas.individuals import (
     SummaryMetrics,
     TransactionSummary,
 )
-from app.services.dashboard_helpers import fetch_category_breakdown
+from app.services.dashboard_helpers import _ZERO, fetch_category_breakdown, to_decimal
 
 LOGGER = get_logger(__name__)
 
@@ -53,23 +54,29 @@ class IndividualsService:
 
         LOGGER.debug("Loading dashboard for individual id=%s", user_id)
 
-        user_party_id = session.execute(
-            select(UserPartyMap.party_id).where(UserPartyMap.user_id == user_id)
-        ).scalar_one_or_none()
-        if user_party_id is None:
-            msg = f"Individual {user_id} not found"
-            LOGGER.warning(msg)
-            raise ValueError(msg)
-
-        party = session.get(Party, user_party_id)
-        if not party:
+        # Mapping, party and profile are resolved in one join rather than three
+        # separate lookups; a missing mapping or party yields no row.
+        identity_row = session.execute(
+            select(
+                UserPartyMap.party_id,
+                Party.display_name,
+                IndividualProfileModel.primary_email,
+            )
+            .join(Party, Party.id == UserPartyMap.party_id)
+            .outerjoin(
+                IndividualProfileModel,
+                IndividualProfileModel.party_id == UserPartyMap.party_id,
+            )
+            .where(UserPartyMap.user_id == user_id)
+        ).first()
+        if identity_row is None:
             msg = f"Individual {user_id} not found"
             LOGGER.warning(msg)
             raise ValueError(msg)
 
-        profile_row = session.get(IndividualProfileModel, user_party_id)
-        display_name = party.display_name or f"User {user_id}"
-        email = profile_row.primary_email if profile_row else None
+        user_party_id = identity_row.party_id
+        display_name = identity_row.display_name or f"User {user_id}"
+        email = identity_row.primary_email
 
         employment_row = session.execute(
             select(
@@ -160,7 +167,7 @@ class IndividualsService:
 
         def _quantile(values: list[Decimal], percentile: float) -> Decimal:
             if not values:
-                return Decimal("0")
+                return _ZERO
             if len(values) == 1:
                 return values[0]
 
@@ -220,7 +227,7 @@ class IndividualsService:
                 period_label = f"Last {self.DEFAULT_PERIOD_DAYS} days"
 
         accounts: list[AccountSummary] = []
-        cash_balance = Decimal("0")
+        cash_balance = _ZERO
 
         if user_party_id:
             account_rows = session.execute(
@@ -241,15 +248,15 @@ class IndividualsService:
                 AccountSummary(
                     id=row.id,
                     name=row.name,
-                    type=str(row.account_type),
+                    type=row.account_type,
                     currency=row.currency,
-                    balance=Decimal(row.balance or 0),
+                    balance=to_decimal(row.balance),
                 )
                 for row in account_rows
             ]
 
         holdings: list[HoldingSummary] = []
-        holdings_total = Decimal("0")
+        holdings_total = _ZERO
         if user_party_id:
             holdings_period_id = session.execute(
                 select(ReportingPeriod.id)
@@ -281,10 +288,10 @@ class IndividualsService:
                 ).all()
 
                 for row in holding_rows:
-                    qty = Decimal(row.quantity or 0)
-                    market_value = Decimal(row.market_value or 0)
+                    qty = to_decimal(row.quantity)
+                    market_value = to_decimal(row.market_value)
                     holdings_total += market_value
-                    last_price = market_value / qty if qty else Decimal("0")
+                    last_price = market_value / qty if qty else _ZERO
                     holdings.append(
                         HoldingSummary(
                             instrument_symbol=row.symbol,
@@ -292,14 +299,14 @@ class IndividualsService:
                             quantity=qty,
                             last_price=last_price,
                             market_value=market_value,
-                            unrealized_pl=Decimal(row.unrealized_pl or 0),
+                            unrealized_pl=to_decimal(row.unrealized_pl),
                         )
                     )
 
         if accounts:
             brokerage_accounts = [account for account in accounts if account.type == AccountType.BROKERAGE.value]
             if brokerage_accounts:
-                per_account_value = holdings_total / len(brokerage_accounts) if holdings_total else Decimal("0")
+                per_account_value = holdings_total / len(brokerage_accounts) if holdings_total else _ZERO
                 brokerage_remaining = holdings_total
                 brokerage_seen = 0
                 updated_accounts: list[AccountSummary] = []
@@ -320,7 +327,7 @@ class IndividualsService:
 
                 accounts = updated_accounts
 
-        cash_deltas: defaultdict[date, Decimal] = defaultdict(lambda: Decimal("0"))
+        cash_deltas: defaultdict[date, Decimal] = defaultdict(lambda: _ZERO)
         if user_party_id:
             cash_rows = session.execute(
                 select(JournalEntry.txn_date, JournalLine.amount)
@@ -336,7 +343,7 @@ class IndividualsService:
             for row in cash_rows:
                 if not row.txn_date:
                     continue
-                cash_deltas[_month_end(row.txn_date)] += Decimal(row.amount or 0)
+                cash_deltas[_month_end(row.txn_date)] += to_decimal(row.amount)
 
         holding_snapshots: list[tuple[date, Decimal, Decimal]] = []
         instrument_qty: dict[int, Decimal] = {}
@@ -362,8 +369,8 @@ class IndividualsService:
                 holding_snapshots.append(
                     (
                         row.period_end,
-                        Decimal(row.market_value or 0),
-                        Decimal(row.unrealized_pl or 0),
+                        to_decimal(row.market_value),
+                        to_decimal(row.unrealized_pl),
                     )
                 )
 
@@ -377,10 +384,10 @@ class IndividualsService:
                 .group_by(HoldingPerformanceFact.instrument_id)
             ).all()
             for row in latest_holdings:
-                instrument_qty[row.instrument_id] = Decimal(row.quantity or 0)
+                instrument_qty[row.instrument_id] = to_decimal(row.quantity)
 
         # Build month-end brokerage value using historical prices
-        brokerage_value_by_month: dict[date, Decimal] = {month: Decimal("0") for month in month_ends}
+        brokerage_value_by_month: dict[date, Decimal] = {month: _ZERO for month in month_ends}
         if instrument_qty:
             price_rows = session.execute(
                 select(PriceQuote.instrument_id, PriceQuote.price_date, PriceQuote.quote_value)
@@ -396,7 +403,7 @@ class IndividualsService:
             for row in price_rows:
                 if row.price_date:
                     prices_by_instrument[row.instrument_id].append(
-                        (row.price_date, Decimal(row.quote_value or 0))
+                        (row.price_date, to_decimal(row.quote_value))
                     )
 
             for instrument_id, qty in instrument_qty.items():
@@ -404,7 +411,7 @@ class IndividualsService:
                     continue
                 series = prices_by_instrument.get(instrument_id, [])
                 pointer = 0
-                last_price = Decimal("0")
+                last_price = _ZERO
                 for month_end in month_ends:
                     while pointer < len(series) and series[pointer][0] <= month_end:
                         last_price = series[pointer][1]
@@ -424,11 +431,11 @@ class IndividualsService:
         net_worth_trend: list[SeriesPoint] = []
         brokerage_value_trend: list[SeriesPoint] = []
 
-        running_cash = Decimal("0")
+        running_cash = _ZERO
 
         for month_end in month_ends:
-            running_cash += cash_deltas.get(month_end, Decimal("0"))
-            current_holdings_value = brokerage_value_by_month.get(month_end, Decimal("0"))
+            running_cash += cash_deltas.get(month_end, _ZERO)
+            current_holdings_value = brokerage_value_by_month.get(month_end, _ZERO)
 
             label = month_end.strftime("%b %Y")
             net_worth_trend.append(
@@ -482,10 +489,8 @@ class IndividualsService:
                 )
             ]
 
-        period_income = sum((category.total for category in income_breakdown), Decimal("0"))
-        period_expenses = sum((category.total for category in expense_breakdown), Decimal("0"))
-        net_cash_flow = period_income - period_expenses
-
+        # Reporting-period facts take precedence; the breakdown totals are only
+        # summed when there are none.
         if latest_cash_period and user_party_id:
             flow_rows = session.execute(
                 select(
@@ -501,14 +506,14 @@ class IndividualsService:
                 )
             ).all()
 
-            income_from_fact = Decimal("0")
-            expense_from_fact = Decimal("0")
-            net_from_fact = Decimal("0")
+            income_from_fact = _ZERO
+            expense_from_fact = _ZERO
+            net_from_fact = _ZERO
 
             for row in flow_rows:
-                inflow = Decimal(row.inflow_amount or 0)
-                outflow = Decimal(row.outflow_amount or 0)
-                net = Decimal(row.net_amount or 0)
+                inflow = to_decimal(row.inflow_amount)
+                outflow = to_decimal(row.outflow_amount)
+                net = to_decimal(row.net_amount)
                 if row.name == "income":
                     income_from_fact += inflow
                 elif row.name == "expense":
@@ -518,6 +523,10 @@ class IndividualsService:
             period_income = income_from_fact
             period_expenses = expense_from_fact
             net_cash_flow = net_from_fact
+        else:
+            period_income = sum((category.total for category in income_breakdown), _ZERO)
+            period_expenses = sum((category.total for category in expense_breakdown), _ZERO)
+            net_cash_flow = period_income - period_expenses
 
         income_peer_split: dict[str, int] | None = None
         monthly_income = None
@@ -554,7 +563,7 @@ class IndividualsService:
             ).all()
 
             income_by_party = {
-                row.party_id: Decimal(row.monthly_income or 0)
+                row.party_id: to_decimal(row.monthly_income)
                 for row in income_rows
                 if row.party_id is not None
             }
@@ -563,29 +572,27 @@ class IndividualsService:
             income_values = sorted(income_by_party.values())
             if income_values:
                 if monthly_income is not None:
-                    rank_position = sum(1 for value in income_values if value <= monthly_income)
+                    # income_values is sorted, so the counts come from two
+                    # binary searches instead of four scans.
+                    lower = bisect_left(income_values, monthly_income)
+                    rank_position = bisect_right(income_values, monthly_income)
                     income_percentile = round((rank_position / len(income_values)) * 100, 1)
-                    higher = sum(1 for value in income_values if value > monthly_income)
-                    lower = sum(1 for value in income_values if value < monthly_income)
-                    peers = sum(1 for value in income_values if value == monthly_income)
+                    higher = len(income_values) - rank_position
+                    peers = rank_position - lower
                     income_peer_split = {
                         "Higher income": higher,
                         "Same income": peers,
                         "Lower income": lower,
                     }
 
-        non_brokerage_balance = sum(
-            (account.balance for account in accounts if account.type != AccountType.BROKERAGE.value),
-            Decimal("0"),
-        )
-        cash_balance = sum(
-            (
-                account.balance
-                for account in accounts
-                if account.type in (AccountType.CHECKING.value, AccountType.SAVINGS.value)
-            ),
-            Decimal("0"),
-        )
+        non_brokerage_balance = _ZERO
+        cash_balance = _ZERO
+        cash_types = (AccountType.CHECKING.value, AccountType.SAVINGS.value)
+        for account in accounts:
+            if account.type != AccountType.BROKERAGE.value:
+                non_brokerage_balance += account.balance
+            if account.type in cash_types:
+                cash_balance += account.balance
         net_worth = non_brokerage_balance + holdings_total
 
         summary = SummaryMetrics(
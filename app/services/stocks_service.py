@@ -23,6 +23,7 @@ from app.schemas.stocks import (
     InstrumentIdentifierPayload,
     InstrumentSnapshot,
 )
+from app.services.dashboard_helpers import _ZERO, to_decimal
 
 LOGGER = get_logger(__name__)
 
@@ -49,7 +50,7 @@ def brokerage_aum_by_party(
         )
         .group_by(Account.party_id)
     )
-    return {row.party_id: Decimal(row.aum or 0) for row in result}
+    return {row.party_id: to_decimal(row.aum) for row in result}
 
 
 class StocksService:
@@ -166,12 +167,12 @@ class StocksService:
             as_of_timestamp = datetime.combine(period_end, time.min)
 
         for row in holdings_rows:
-            quantity = Decimal(row.quantity or 0)
-            cost_basis = Decimal(row.cost_basis or 0)
-            market_value = Decimal(row.market_value or 0)
-            unrealized_pl = Decimal(row.unrealized_pl or 0)
+            quantity = to_decimal(row.quantity)
+            cost_basis = to_decimal(row.cost_basis)
+            market_value = to_decimal(row.market_value)
+            unrealized_pl = to_decimal(row.unrealized_pl)
 
-            average_cost = Decimal("0")
+            average_cost = _ZERO
             if quantity != 0:
                 average_cost = cost_basis / quantity
 
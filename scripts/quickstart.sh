@@ -293,7 +293,7 @@ if [[ "${START_SERVER}" == "1" ]]; then
   }
 
   trap cleanup EXIT INT TERM
-  uvicorn app.main:app --host "${UVICORN_HOST}" --port "${UVICORN_PORT}" --log-level "${UVICORN_LOG_LEVEL}" --reload &
+  APP_DEBUG=1 uvicorn app.main:app --host "${UVICORN_HOST}" --port "${UVICORN_PORT}" --log-level "${UVICORN_LOG_LEVEL}" --reload &
   UVICORN_PID=$!
   echo "FastAPI application running at http://${UVICORN_HOST}:${UVICORN_PORT} (PID ${UVICORN_PID})."
   echo "Press Ctrl+C to stop the server."
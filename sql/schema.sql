@@ -204,7 +204,7 @@ CREATE TABLE IF NOT EXISTS employment_contract (
   end_date DATE NULL,
   is_primary TINYINT(1) NOT NULL DEFAULT 1,
   UNIQUE KEY uq_contract_employee_employer_start (employee_party_id, employer_party_id, start_date),
-  INDEX ix_employment_employee (employee_party_id),
+  INDEX ix_employment_employee_current (employee_party_id, is_primary, start_date),
   INDEX ix_employment_employer (employer_party_id),
   FOREIGN KEY (employee_party_id) REFERENCES party(id),
   FOREIGN KEY (employer_party_id) REFERENCES party(id)
@@ -254,7 +254,7 @@ CREATE TABLE IF NOT EXISTS account (
   iban VARCHAR(34) NULL,
   opened_at DATETIME NOT NULL DEFAULT CURRENT_TIMESTAMP,
   closed_at DATETIME NULL,
-  INDEX ix_account_party (party_id),
+  INDEX ix_account_party_type (party_id, account_type_code),
   INDEX ix_account_type (account_type_code),
   UNIQUE KEY uniq_iban (iban),
   FOREIGN KEY (party_id) REFERENCES party(id),
@@ -333,6 +333,7 @@ CREATE TABLE IF NOT EXISTS journal_entry (
   external_reference VARCHAR(64) NULL,
   created_at DATETIME NOT NULL DEFAULT CURRENT_TIMESTAMP,
   INDEX ix_journal_transfer (transfer_reference),
+  INDEX ix_journal_entry_date (txn_date),
   FOREIGN KEY (channel_code) REFERENCES txn_channel(code),
   FOREIGN KEY (counterparty_party_id) REFERENCES party(id)
 ) ENGINE=InnoDB;
@@ -348,7 +349,7 @@ CREATE TABLE IF NOT EXISTS journal_line (
   line_memo VARCHAR(255),
   created_at DATETIME NOT NULL DEFAULT CURRENT_TIMESTAMP,
   INDEX ix_journal_line_entry (entry_id),
-  INDEX ix_journal_line_account (account_id),
+  INDEX ix_journal_line_account_entry (account_id, entry_id),
   INDEX ix_journal_line_party (party_id),
   INDEX ix_journal_line_category (category_id),
   FOREIGN KEY (entry_id) REFERENCES journal_entry(id),
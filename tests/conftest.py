@@ -1,10 +1,29 @@
-"""Pytest configuration for ensuring local imports resolve."""
+"""Pytest configuration: local import path and shared fixtures."""
 from __future__ import annotations
 
 import sys
 from pathlib import Path
 
+import pytest
+
 ROOT = Path(__file__).resolve().parent.parent
 
 if str(ROOT) not in sys.path:
     sys.path.insert(0, str(ROOT))
+
+from app.core.config import AuthSettings  # noqa: E402 - needs the path above
+from app.core.security import SecurityProvider, clear_decode_cache  # noqa: E402
+
+
+@pytest.fixture()
+def provider() -> SecurityProvider:
+    settings = AuthSettings(
+        secret_key="test-secret-key-with-at-least-32-bytes",
+        algorithm="HS256",
+        access_token_expire_minutes=5,
+        admin_username="admin",
+        admin_password="admin-pass",
+        demo_user_password="demo",
+    )
+    clear_decode_cache()
+    return SecurityProvider(settings, session_factory=lambda: None)
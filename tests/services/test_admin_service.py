@@ -5,7 +5,7 @@ from datetime import date, datetime, timezone
 from decimal import Decimal
 
 import pytest
-from sqlalchemy import create_engine, text
+from sqlalchemy import Column, MetaData, String, Table, create_engine, text
 from sqlalchemy.orm import Session, sessionmaker
 
 from app.models import (
@@ -23,7 +23,8 @@ from app.models.memberships import EmploymentContract
 from app.models.party import CompanyProfile as CompanyProfileModel
 from app.models.party import IndividualProfile as IndividualProfileModel
 from app.models.party import Party, PartyType
-from app.schemas.admin import AdminMetrics
+from app.schemas.admin import AdminMetrics, ListView, ListViewColumn, ListViewRow
+from app.services import admin_service as admin_service_module
 from app.services.admin_service import AdminService
 
 
@@ -264,3 +265,74 @@ def test_get_metrics_with_no_transactions(session: Session, admin_service: Admin
     assert metrics.first_transaction_at is None
     assert metrics.last_transaction_at is None
     assert metrics.total_aum == Decimal("0")
+
+
+def test_snapshot_round_trip(tmp_path, monkeypatch) -> None:
+    monkeypatch.setattr(AdminService, "_engine_key", staticmethod(lambda session: "snapshot-test"))
+    monkeypatch.setattr(
+        AdminService, "dataset_fingerprint", classmethod(lambda cls, session: "abc123")
+    )
+    distributions = admin_service_module._INDIVIDUAL_DISTRIBUTIONS
+    overviews = admin_service_module._COMPANY_OVERVIEWS
+    series = admin_service_module._STOCK_SERIES_CACHE
+    overview = ListView(
+        title="Companies",
+        columns=[ListViewColumn(key="profit_total", title="Profit", column_type="currency")],
+        rows=[
+            ListViewRow(
+                key="1",
+                values={"profit_total": Decimal("12.50"), "since": date(2024, 1, 31)},
+            )
+        ],
+    )
+    distributions["snapshot-test"] = {"Under €50k": 3}
+    overviews["snapshot-test"] = overview
+    series["snapshot-test"] = ([("2024-01", 1.5)], "AAPL", None)
+    try:
+        stale = tmp_path / "admin_warm_old.pkl"
+        stale.write_bytes(b"")
+        in_flight = tmp_path / "tmp-1-admin_warm_other.json"
+        in_flight.write_bytes(b"")
+        written = AdminService.write_snapshot(None, tmp_path)  # type: ignore[arg-type]
+
+        assert written.name == "admin_warm_abc123.json"
+        assert not stale.exists()
+        assert in_flight.exists()
+
+        del distributions["snapshot-test"], overviews["snapshot-test"], series["snapshot-test"]
+        assert AdminService.load_snapshot(None, tmp_path)  # type: ignore[arg-type]
+        assert distributions["snapshot-test"] == {"Under €50k": 3}
+        assert overviews["snapshot-test"] == overview
+        assert overviews["snapshot-test"].rows[0].values["profit_total"] == Decimal("12.50")
+        assert series["snapshot-test"] == ([("2024-01", 1.5)], "AAPL", None)
+
+        written.write_text('{"company_overviews": {"title": 1}}', encoding="utf-8")
+        assert not AdminService.load_snapshot(None, tmp_path)  # type: ignore[arg-type]
+
+        written.unlink()
+        assert not AdminService.load_snapshot(None, tmp_path)  # type: ignore[arg-type]
+    finally:
+        distributions.pop("snapshot-test", None)
+        overviews.pop("snapshot-test", None)
+        series.pop("snapshot-test", None)
+
+
+def test_dataset_fingerprint_tracks_new_rows() -> None:
+    # The lookup tables referenced by Account/JournalLine are not mapped, so
+    # build a private copy of the schema with stand-ins for them.
+    metadata = MetaData()
+    for table in Base.metadata.tables.values():
+        table.to_metadata(metadata)
+    for name in ("account_type", "currency"):
+        Table(name, metadata, Column("code", String(32), primary_key=True))
+    engine = create_engine("sqlite:///:memory:", future=True)
+    metadata.create_all(engine)
+
+    with Session(engine) as session:
+        before = AdminService.dataset_fingerprint(session)
+        assert AdminService.dataset_fingerprint(session) == before
+
+        session.add(Party(id=1, party_type=PartyType.INDIVIDUAL, display_name="Alice"))
+        session.commit()
+
+        assert AdminService.dataset_fingerprint(session) != before
@@ -0,0 +1,45 @@
+"""Tests for the companies service identity cache."""
+from __future__ import annotations
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import Session
+
+from app.models import Base
+from app.models.party import CompanyProfile as CompanyProfileModel
+from app.models.party import Party, PartyType
+from app.services import companies_service as companies_service_module
+from app.services.companies_service import CompaniesService
+from app.services.dashboard_helpers import engine_cache_key
+
+
+@pytest.fixture()
+def session() -> Session:
+    """Provide an in-memory session with the company identity tables."""
+
+    engine = create_engine("sqlite:///:memory:", future=True)
+    tables = Base.metadata.tables
+    Base.metadata.create_all(
+        engine,
+        tables=[tables["party"], tables["company_profile"], tables["org"], tables["org_party_map"]],
+    )
+    CompaniesService.clear_identity_cache()
+    with Session(engine) as session:
+        yield session
+    CompaniesService.clear_identity_cache()
+
+
+def test_company_identity_is_cached_per_engine_until_cleared(session: Session) -> None:
+    party = Party(id=1, party_type=PartyType.COMPANY, display_name="Acme")
+    session.add_all([party, CompanyProfileModel(party_id=1, legal_name="Acme B.V.")])
+    session.commit()
+
+    assert CompaniesService._company_identity(session, 1) == (1, "Acme")
+    assert list(companies_service_module._COMPANY_IDENTITIES) == [engine_cache_key(session)]
+
+    party.display_name = "Acme Holding"
+    session.commit()
+    assert CompaniesService._company_identity(session, 1) == (1, "Acme")
+
+    CompaniesService.clear_identity_cache()
+    assert CompaniesService._company_identity(session, 1) == (1, "Acme Holding")
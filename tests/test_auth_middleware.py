@@ -0,0 +1,88 @@
+"""Tests for the login-enforcing ASGI middleware."""
+from __future__ import annotations
+
+import pytest
+from starlette.applications import Starlette
+from starlette.requests import Request
+from starlette.responses import PlainTextResponse
+from starlette.routing import Route
+from starlette.testclient import TestClient
+
+from app.core.security import AuthenticatedUser, SecurityProvider, current_user
+from app.middleware.auth import AuthMiddleware
+from app.middleware.forwarded_prefix import ForwardedPrefixMiddleware
+
+
+@pytest.fixture()
+def client(provider: SecurityProvider) -> TestClient:
+    def whoami(request: Request) -> PlainTextResponse:
+        user = current_user()
+        return PlainTextResponse(user.username if user else "anonymous")
+
+    app = Starlette(
+        routes=[
+            Route("/private", whoami),
+            Route("/login", whoami),
+            Route("/static/app.css", whoami),
+        ]
+    )
+    app.add_middleware(AuthMiddleware, security_provider=provider)
+    app.add_middleware(ForwardedPrefixMiddleware)
+    return TestClient(app, follow_redirects=False)
+
+
+def test_anonymous_request_redirects_to_login(client: TestClient) -> None:
+    response = client.get("/private")
+
+    assert response.status_code == 303
+    assert response.headers["location"] == "/login"
+
+    prefixed = client.get("/private", headers={"x-forwarded-prefix": "/finance"})
+    assert prefixed.headers["location"] == "/finance/login"
+
+
+def test_exempt_paths_pass_through(client: TestClient) -> None:
+    assert client.get("/static/app.css").text == "anonymous"
+    assert client.get("/login").text == "anonymous"
+
+
+def test_valid_cookie_sets_current_user(
+    client: TestClient, provider: SecurityProvider
+) -> None:
+    token = provider.create_access_token(AuthenticatedUser(username="admin", role="admin"))
+    client.cookies.set(provider.cookie_name, token)
+
+    response = client.get("/private")
+
+    assert response.status_code == 200
+    assert response.text == "admin"
+
+
+def test_invalid_cookie_is_cleared(client: TestClient, provider: SecurityProvider) -> None:
+    client.cookies.set(provider.cookie_name, "not-a-token")
+
+    response = client.get("/private")
+
+    assert response.status_code == 303
+    assert f'{provider.cookie_name}=""' in response.headers["set-cookie"]
+
+
+def test_static_requests_skip_cookie_decoding(
+    client: TestClient, provider: SecurityProvider
+) -> None:
+    client.cookies.set(provider.cookie_name, "not-a-token")
+
+    response = client.get("/static/app.css")
+
+    assert response.status_code == 200
+    assert response.text == "anonymous"
+
+
+def test_current_user_is_scoped_to_the_request(
+    client: TestClient, provider: SecurityProvider
+) -> None:
+    token = provider.create_access_token(AuthenticatedUser(username="admin", role="admin"))
+    client.cookies.set(provider.cookie_name, token)
+
+    assert client.get("/private").text == "admin"
+    assert current_user() is None
@@ -0,0 +1,67 @@
+"""Tests for the ``.env`` loader."""
+from __future__ import annotations
+
+import os
+
+import pytest
+
+from app.core.envfile import load_env_file
+
+KEYS = ("PLAIN", "DOUBLE", "SINGLE", "COMMENTED", "EXPORTED", "ESCAPED", "LITERAL", "EMPTY")
+
+
+@pytest.fixture(autouse=True)
+def clean_environ(monkeypatch: pytest.MonkeyPatch) -> None:
+    for key in KEYS:
+        monkeypatch.delenv(key, raising=False)
+
+
+def _load(tmp_path, content: str, **kwargs) -> bool:
+    env_file = tmp_path / ".env"
+    env_file.write_text(content, encoding="utf-8")
+    return load_env_file(env_file, **kwargs)
+
+
+def test_quoted_values_drop_quotes_and_inline_comments(tmp_path) -> None:
+    _load(
+        tmp_path,
+        "# leading comment\n"
+        "PLAIN=value # note\n"
+        'DOUBLE="x y" # note\n'
+        "SINGLE='a # b'  # note\n"
+        "COMMENTED=#not-a-comment\n"
+        "EMPTY=\n",
+    )
+
+    assert os.environ["PLAIN"] == "value"
+    assert os.environ["DOUBLE"] == "x y"
+    assert os.environ["SINGLE"] == "a # b"
+    assert os.environ["COMMENTED"] == "#not-a-comment"
+    assert os.environ["EMPTY"] == ""
+
+
+def test_export_prefix_and_escapes(tmp_path) -> None:
+    _load(
+        tmp_path,
+        "export EXPORTED=1\n"
+        'ESCAPED="line\\nnext \\"quoted\\" back\\\\slash"\n'
+        "LITERAL='no\\nescape \\'q\\''\n",
+    )
+
+    assert os.environ["EXPORTED"] == "1"
+    assert os.environ["ESCAPED"] == 'line\nnext "quoted" back\\slash'
+    assert os.environ["LITERAL"] == "no\\nescape 'q'"
+
+
+def test_existing_variables_win_unless_overridden(tmp_path, monkeypatch) -> None:
+    monkeypatch.setenv("PLAIN", "from-env")
+
+    _load(tmp_path, "PLAIN=from-file\n")
+    assert os.environ["PLAIN"] == "from-env"
+
+    _load(tmp_path, "PLAIN=from-file\n", override=True)
+    assert os.environ["PLAIN"] == "from-file"
+
+
+def test_missing_file_returns_false(tmp_path) -> None:
+    assert load_env_file(tmp_path / "missing.env") is False
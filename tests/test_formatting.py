@@ -0,0 +1,50 @@
+"""Tests for the number and currency formatting helpers."""
+from __future__ import annotations
+
+from decimal import Decimal
+
+import pytest
+
+from app.core.formatting import (
+    _humanize_currency_cached,
+    humanize_currency,
+    humanize_number,
+)
+
+
+@pytest.mark.parametrize(
+    ("value", "expected"),
+    [
+        (0, "0"),
+        (42, "42"),
+        (9999.5, "9999.5"),
+        (Decimal("1200.00"), "1200"),
+        (10000, "10.0 thousand"),
+        (12345.67, "12.3 thousand"),
+        (-2500000, "-2.5 million"),
+        (Decimal("1234567.89"), "1.2 million"),
+        (3_400_000_000, "3.4 billion"),
+        (1.5e12, "1.5 trillion"),
+    ],
+)
+def test_humanize_number_long_units(value, expected) -> None:
+    assert humanize_number(value) == expected
+
+
+def test_humanize_number_short_units() -> None:
+    assert humanize_number(10000, short=True) == "10.0k"
+    assert humanize_number(Decimal("-7250000"), short=True, decimals=2) == "-7.25M"
+
+
+def test_humanize_currency_prefixes_symbol() -> None:
+    assert humanize_currency(Decimal("1234567.89")) == "€ 1.2 million"
+    assert humanize_currency(250, symbol="$") == "$ 250"
+
+
+def test_humanize_currency_is_memoised() -> None:
+    _humanize_currency_cached.cache_clear()
+    first = humanize_currency(Decimal("2500000"), short=True)
+    second = humanize_currency(Decimal("2500000"), short=True)
+
+    assert first == second == "€ 2.5M"
+    assert _humanize_currency_cached.cache_info().hits == 1
@@ -0,0 +1,190 @@
+"""Tests for the queue-based logging pipeline."""
+from __future__ import annotations
+
+import io
+import logging
+from contextlib import contextmanager
+from logging.handlers import QueueHandler
+from pathlib import Path
+from queue import SimpleQueue
+
+import pytest
+from rich.console import Console
+from sqlalchemy import create_engine, event, text
+from sqlalchemy.orm import Session
+
+from app.core.log import (
+    BatchingQueueListener,
+    CachedTimeFormatter,
+    DailyFileHandler,
+    init_logging,
+    shutdown_logging,
+)
+from app.core.log.context import ContextFilter, log_context
+from app.core.log.progress import ProgressManager, _NullTask
+from app.core.log.timing import DatabaseCallTracker, timeit
+
+
+def test_batching_listener_writes_all_records(tmp_path) -> None:
+    handler = DailyFileHandler(tmp_path)
+    handler.setFormatter(logging.Formatter("%(levelname)s %(message)s"))
+    handler.setLevel(logging.INFO)
+
+    log_queue: SimpleQueue = SimpleQueue()
+    listener = BatchingQueueListener(log_queue, handler, respect_handler_level=True)
+    logger = logging.getLogger("tests.batching")
+    logger.propagate = False
+    logger.setLevel(logging.DEBUG)
+    logger.addHandler(QueueHandler(log_queue))
+    try:
+        listener.start()
+        logger.debug("dropped")
+        for i in range(600):
+            logger.info("line %d", i)
+        listener.stop()
+    finally:
+        logger.handlers.clear()
+        handler.close()
+
+    lines = Path(handler.baseFilename).read_text(encoding="utf-8").splitlines()
+    assert len(lines) == 600
+    assert lines[0] == "INFO line 0"
+    assert lines[-1] == "INFO line 599"
+
+
+def test_context_filter_renders_bound_values() -> None:
+    record = logging.LogRecord("t", logging.INFO, __file__, 1, "msg", None, None)
+    context_filter = ContextFilter()
+    log_context.clear()
+    try:
+        context_filter.filter(record)
+        assert record.context == ""
+
+        log_context.bind(job="load", rows=3, skipped=None)
+        context_filter.filter(record)
+        assert record.context == "job=load rows=3 "
+        assert log_context.as_dict() == {"job": "load", "rows": 3}
+
+        log_context.unbind("job")
+        context_filter.filter(record)
+        assert record.context == "rows=3 "
+    finally:
+        log_context.clear()
+
+
+def test_cached_time_formatter_matches_stock_formatter() -> None:
+    fmt, datefmt = "%(asctime)s | %(levelname)-8s | %(message)s", "%Y-%m-%d %H:%M:%S"
+    cached = CachedTimeFormatter(fmt, datefmt=datefmt)
+    stock = logging.Formatter(fmt, datefmt=datefmt)
+
+    for created in (1_700_000_000.1, 1_700_000_000.9, 1_700_000_001.0):
+        record = logging.LogRecord("t", logging.INFO, __file__, 1, "msg", None, None)
+        record.created = created
+        assert cached.format(record) == stock.format(record)
+
+
+def test_daily_file_handler_rolls_over_at_midnight(tmp_path) -> None:
+    handler = DailyFileHandler(tmp_path)
+    handler.setFormatter(logging.Formatter("%(message)s"))
+    try:
+        today = Path(handler.baseFilename)
+        record = logging.LogRecord("t", logging.INFO, __file__, 1, "today", None, None)
+        handler.emit(record)
+
+        tomorrow = logging.LogRecord("t", logging.INFO, __file__, 1, "tomorrow", None, None)
+        tomorrow.created = handler._next_rollover + 1
+        handler.emit(tomorrow)
+    finally:
+        handler.close()
+
+    assert today.read_text(encoding="utf-8") == "today\n"
+    assert Path(handler.baseFilename) != today
+    assert Path(handler.baseFilename).read_text(encoding="utf-8") == "tomorrow\n"
+
+
+def test_track_batches_progress_advances() -> None:
+    manager = ProgressManager()
+    advances: list[float] = []
+
+    class _Recorder:
+        def advance(self, amount: float = 1.0) -> None:
+            advances.append(amount)
+
+    @contextmanager
+    def _task(*args: object, **kwargs: object):
+        yield _Recorder()
+
+    manager.task = _task  # type: ignore[method-assign]
+
+    items = list(manager.track(range(2500), description="rows", batch=1000, interval=3600))
+
+    assert items == list(range(2500))
+    assert advances == [1000, 1000, 500]
+
+
+def test_progress_is_skipped_without_terminal() -> None:
+    manager = ProgressManager()
+    manager.use_console(Console(file=io.StringIO(), force_terminal=False))
+
+    with manager.task("rows", total=3) as task:
+        assert isinstance(task, _NullTask)
+        task.advance(3)
+    with manager.spinner("working"):
+        pass
+
+
+class _RecordingHandler(logging.Handler):
+    def __init__(self) -> None:
+        super().__init__()
+        self.closed = False
+
+    def close(self) -> None:
+        self.closed = True
+        super().close()
+
+
+def test_teardown_closes_only_handlers_it_created(tmp_path) -> None:
+    root = logging.getLogger()
+    try:
+        shutdown_logging()
+        init_logging(log_dir=tmp_path, console=False)
+        owned = list(root.handlers)
+        foreign = _RecordingHandler()
+        root.addHandler(foreign)
+
+        shutdown_logging()
+
+        assert not foreign.closed
+        assert all(isinstance(handler, QueueHandler) for handler in owned)
+        assert foreign not in root.handlers
+    finally:
+        # Back to the default configuration the application starts with.
+        shutdown_logging()
+        init_logging()
+
+
+def test_database_call_tracker_counts_and_detaches() -> None:
+    engine = create_engine("sqlite:///:memory:", future=True)
+    with Session(engine) as session:
+        tracker = DatabaseCallTracker()
+        tracker.track_calls(session)
+        session.execute(text("SELECT 1"))
+        session.execute(text("SELECT 2"))
+        tracker.stop()
+        session.execute(text("SELECT 3"))
+
+        assert tracker.call_count == 2
+        assert not event.contains(session, "do_orm_execute", tracker._on_execute)
+
+
+def test_timeit_detaches_tracker_on_base_exception() -> None:
+    engine = create_engine("sqlite:///:memory:", future=True)
+    with Session(engine) as session:
+        with pytest.raises(KeyboardInterrupt):
+            with timeit("interrupted", track_db_calls=True, session=session) as timer:
+                session.execute(text("SELECT 1"))
+                raise KeyboardInterrupt
+
+        tracker = timer.db_call_tracker
+        assert tracker is not None and tracker.call_count == 1
+        assert not event.contains(session, "do_orm_execute", tracker._on_execute)
@@ -0,0 +1,71 @@
+"""Tests for JWT issuing and verification in the security provider."""
+from __future__ import annotations
+
+import time
+
+import jwt
+import pytest
+
+import app.core.security as security_module
+from app.core.security import (
+    AuthenticatedUser,
+    AuthenticationError,
+    SecurityProvider,
+)
+
+
+def test_token_round_trip(provider: SecurityProvider) -> None:
+    user = AuthenticatedUser(
+        username="alice",
+        role="individual",
+        subject_id=7,
+        app_user_id=5,
+        party_id=1,
+        roles=("EMPLOYEE", "USER"),
+        company_ids=(2, 20),
+    )
+
+    token = provider.create_access_token(user)
+
+    assert provider.decode_token(token) == user
+    assert provider.decode_token(token) == user
+
+
+def test_expired_token_is_rejected_on_cache_hit(
+    provider: SecurityProvider, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    token = provider.create_access_token(AuthenticatedUser(username="admin", role="admin"))
+    provider.decode_token(token)
+
+    real_time = security_module.time.time
+    monkeypatch.setattr(security_module.time, "time", lambda: real_time() + 3600)
+
+    with pytest.raises(AuthenticationError):
+        provider.decode_token(token)
+
+
+def test_tampered_token_is_rejected(provider: SecurityProvider) -> None:
+    token = provider.create_access_token(AuthenticatedUser(username="admin", role="admin"))
+    header, payload, signature = token.split(".")
+
+    with pytest.raises(AuthenticationError):
+        provider.decode_token(f"{header}.{payload}.{signature[::-1]}")
+
+
+def test_admin_credentials_authenticate_without_database(provider: SecurityProvider) -> None:
+    assert provider.authenticate("admin", "admin-pass") == AuthenticatedUser(
+        username="admin", role="admin"
+    )
+    assert provider.authenticate("admin", "wrong") is None
+    assert provider.authenticate("someone", "wrong") is None
+
+
+def test_tokens_with_other_headers_fall_back_to_pyjwt(provider: SecurityProvider) -> None:
+    token = jwt.encode(
+        {"sub": "bob", "role": "individual", "exp": int(time.time()) + 60},
+        "test-secret-key-with-at-least-32-bytes",
+        algorithm="HS256",
+        headers={"kid": "k1"},
+    )
+
+    assert provider.decode_token(token) == AuthenticatedUser(username="bob", role="individual")